@@ -0,0 +1,82 @@
+"""
+Config Cache
+Loads config.json once per process and shares the parsed result between
+the command-line handling and the launcher.
+"""
+
+import os
+import json
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+CONFIG_FILE = "config.json"
+
+# Config path -> (file mtime in ns or None if missing, parsed config)
+_cache: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+
+
+def _mtime(path: str) -> Optional[int]:
+    """Get a file's modification time, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_config(path: str = CONFIG_FILE) -> Dict[str, Any]:
+    """
+    Load a config file, reusing the parsed result while the file is unchanged.
+    The returned dictionary is shared: callers that change it should write
+    it back with save_config().
+
+    Args:
+        path: Path to the config file
+
+    Returns:
+        Configuration dictionary (empty if the file is missing or invalid)
+    """
+    mtime = _mtime(path)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = {}
+    if mtime is not None:
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            config = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        # Covers json.JSONDecodeError (and orjson's subclass of it) and
+        # undecodable bytes
+        except (ValueError, IOError) as e:
+            print(f"Error loading config: {e}")
+
+    _cache[path] = (mtime, config)
+    return config
+
+
+def save_config(config: Dict[str, Any], path: str = CONFIG_FILE):
+    """
+    Write a config file and make it the cached config for that path.
+
+    Args:
+        config: Configuration dictionary
+        path: Path to the config file
+
+    Raises:
+        IOError: If the file could not be written
+    """
+    # Still indented, as the file is meant to be edited by hand; 2 spaces
+    # either way, the only indent orjson supports
+    if HAS_ORJSON:
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
+    _cache[path] = (_mtime(path), config)
@@ -9,12 +9,17 @@ Features:
 - Fallback support for generic controllers
 """
 
+import array
+import logging
 import pygame
+import re
 import time
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 from dataclasses import dataclass
 from enum import Enum, auto
 
+log = logging.getLogger(__name__)
+
 
 class InputAction(Enum):
     """Enumeration of possible input actions."""
@@ -29,7 +34,45 @@ class InputAction(Enum):
     NONE = auto()
 
 
-@dataclass
+# Module-level aliases so the per-frame input paths resolve actions with a
+# single global lookup instead of an enum attribute lookup
+_UP = InputAction.UP
+_DOWN = InputAction.DOWN
+_LEFT = InputAction.LEFT
+_RIGHT = InputAction.RIGHT
+_CONFIRM = InputAction.CONFIRM
+_BACK = InputAction.BACK
+_OPTIONS = InputAction.OPTIONS
+_RESCAN = InputAction.RESCAN
+_NONE = InputAction.NONE
+
+def _compile_substring_pattern(needles) -> 're.Pattern[str]':
+    """
+    Compile literal substrings into a single alternation pattern.
+    Needles containing another needle are dropped: wherever they match,
+    the shorter one matches too, so they only add work to every search.
+
+    Args:
+        needles: Literal substrings to search for
+
+    Returns:
+        Compiled pattern matching any of the needles
+    """
+    needles = set(needles)
+    minimal = sorted(n for n in needles if not any(o != n and o in n for o in needles))
+    return re.compile('|'.join(map(re.escape, minimal)))
+
+
+# D-pad hat value -> action; vertical wins on diagonals
+_HAT_ACTIONS = {
+    (0, 1): _UP, (-1, 1): _UP, (1, 1): _UP,
+    (0, -1): _DOWN, (-1, -1): _DOWN, (1, -1): _DOWN,
+    (-1, 0): _LEFT,
+    (1, 0): _RIGHT,
+}
+
+
+@dataclass(slots=True)
 class ControllerState:
     """Represents the current state of the controller."""
     connected: bool = False
@@ -37,6 +80,16 @@ class ControllerState:
     battery_level: int = -1  # -1 if unknown
 
 
+@dataclass(frozen=True, slots=True)
+class ButtonPrompts:
+    """Button labels shown in on-screen prompts, by action."""
+    confirm: str
+    back: str
+    options: str
+    rescan: str
+    navigate: str
+
+
 class InputHandler:
     """
     Handles input from PS4/PS5 controllers and keyboard.
@@ -71,6 +124,79 @@ class InputHandler:
     # D-pad hat mapping
     DPAD_HAT = 0
 
+    # PlayStation controller identifiers
+    # Covers USB, Bluetooth, and various OS/driver combinations
+    PS_IDENTIFIERS = (
+        'playstation',
+        'ps4', 'ps5',
+        'dualshock', 'dualsense',
+        'wireless controller',
+        'ps4 controller',
+        'ps5 controller',
+        'sony interactive entertainment',
+        'sony computer entertainment',
+        'cuh-zct',  # PS4 controller model numbers
+        'cfi-zct',  # PS5 controller model numbers
+        '054c:05c4',  # PS4 USB vendor:product ID
+        '054c:09cc',  # PS4 Bluetooth vendor:product ID
+        '054c:0ce6',  # PS5 vendor:product ID
+    )
+
+    # All identifiers compiled into one pattern, matched in a single pass
+    _PS_NAME_RE = _compile_substring_pattern(PS_IDENTIFIERS)
+
+    # Keyboard bindings in priority order (first held key wins)
+    KEY_BINDINGS = (
+        (pygame.K_UP, _UP), (pygame.K_w, _UP),
+        (pygame.K_DOWN, _DOWN), (pygame.K_s, _DOWN),
+        (pygame.K_LEFT, _LEFT), (pygame.K_a, _LEFT),
+        (pygame.K_RIGHT, _RIGHT), (pygame.K_d, _RIGHT),
+        (pygame.K_RETURN, _CONFIRM), (pygame.K_SPACE, _CONFIRM),
+        (pygame.K_ESCAPE, _BACK), (pygame.K_BACKSPACE, _BACK),
+        (pygame.K_TAB, _OPTIONS), (pygame.K_o, _OPTIONS),
+        (pygame.K_r, _RESCAN),
+    )
+
+    # Bound key -> (priority, action), so held keys are looked up directly
+    # instead of probing every binding
+    _KEY_RANKS = {key: (rank, action) for rank, (key, action) in enumerate(KEY_BINDINGS)}
+
+    # Button prompt labels for each input method, shared read-only with
+    # the UI instead of being rebuilt per frame
+    _PROMPTS_CONTROLLER = ButtonPrompts(
+        confirm='✕',
+        back='○',
+        options='OPTIONS',
+        rescan='△',
+        navigate='D-Pad/L-Stick'
+    )
+    _PROMPTS_KEYBOARD = ButtonPrompts(
+        confirm='Enter',
+        back='Esc',
+        options='Tab',
+        rescan='R',
+        navigate='Arrow Keys'
+    )
+
+    # How long a released action stays current (ms), so a bouncing button
+    # contact isn't read as a second press
+    RELEASE_DEBOUNCE = 10
+
+    # Size of the cached axis state tables
+    MAX_AXES = 8
+
+    # Margin around the deadzone the stick must cross to activate or
+    # release, so sticks resting near the edge don't chatter
+    AXIS_HYSTERESIS = 0.05
+
+    # SDL events that carry input state
+    INPUT_EVENT_TYPES = (
+        pygame.KEYDOWN, pygame.KEYUP,
+        pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+        pygame.JOYHATMOTION, pygame.JOYAXISMOTION,
+    )
+    _INPUT_EVENT_SET = frozenset(INPUT_EVENT_TYPES)  # O(1) membership tests
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the input handler.
@@ -82,35 +208,81 @@ class InputHandler:
         self.deadzone = config.get('deadzone', 0.3)
         self.repeat_delay = config.get('repeat_delay', 500)  # ms before repeat starts
         self.repeat_interval = config.get('repeat_interval', 150)  # ms between repeats
+        self.debug_buttons = config.get('debug_buttons', False)  # log raw button presses
+        self.poll_input = config.get('poll_input', False)  # query device state instead of events
+        self.poll_interval = config.get('poll_interval', 8)  # min ms between device polls
+
+        # Squared radii of the circular stick deadzone (activate / release)
+        self._stick_on_sq = (self.deadzone + self.AXIS_HYSTERESIS) ** 2
+        self._stick_off_sq = max(0.0, self.deadzone - self.AXIS_HYSTERESIS) ** 2
+
+        # Input timing runs on time.monotonic_ns(); convert the ms settings once
+        self._repeat_delay_ns = int(self.repeat_delay * 1_000_000)
+        self._repeat_interval_ns = int(self.repeat_interval * 1_000_000)
+        self._poll_interval_ns = int(self.poll_interval * 1_000_000)
+        self._release_debounce_ns = self.RELEASE_DEBOUNCE * 1_000_000
 
         self.joystick: Optional[pygame.joystick.JoystickType] = None
         self.state = ControllerState()
 
+        # Face-button bindings in priority order as (bit mask, action),
+        # resolved once from the PS_BUTTON_* mapping so the per-frame check
+        # is a few bit tests against the held-button mask
+        self._button_actions = (
+            (1 << self.PS_BUTTON_CROSS, _CONFIRM),
+            (1 << self.PS_BUTTON_CIRCLE, _BACK),
+            (1 << self.PS_BUTTON_OPTIONS, _OPTIONS),
+            (1 << self.PS_BUTTON_TRIANGLE, _RESCAN),
+        )
+
+        # Controller name -> is PlayStation, so reconnects skip the match
+        self._ps_name_cache: Dict[str, bool] = {}
+
+        # Controller capabilities, cached at connect time
+        self._num_buttons = 0
+        self._num_axes = 0
+        self._num_hats = 0
+        self._instance_id = -1
+
+        # Held input state, updated from SDL events in handle_event().
+        # Buttons are a bit mask (bit n = button n), axes a packed array
+        self._keys_down = set()
+        self._buttons_down = 0
+        self._axes = array.array('f', bytes(4 * self.MAX_AXES))
+        self._stick_action: Optional[InputAction] = None  # left-stick direction, if outside the deadzone
+        self._hat = (0, 0)
+        self._last_pressed_buttons = ()  # last set logged by _log_pressed_buttons
+
         # Input repeat tracking
-        self._last_action = InputAction.NONE
+        self._last_poll_time = 0
+        self._last_action = _NONE
         self._action_start_time = 0
         self._last_repeat_time = 0
-        self._action_triggered = False
+        self._release_time: Optional[int] = None  # when the held action was released, if it was
+        self._last_event_time = 0  # monotonic time (ns) of the latest input event
 
-        # Initialize joystick subsystem
-        pygame.joystick.init()
-        self._connect_controller()
+        # Controllers are enumerated on first use (see _ensure_joystick) so
+        # creating the handler doesn't wait on device discovery
+        self._joystick_ready = False
+
+    def _ensure_joystick(self):
+        """Initialize the joystick subsystem and connect, once, on first use."""
+        if not self._joystick_ready:
+            self._joystick_ready = True
+            pygame.joystick.init()
+            self._connect_controller()
 
     def _connect_controller(self) -> bool:
         """
         Attempt to connect to a controller.
-        Only reinitializes if necessary to avoid spurious events.
+        The joystick subsystem is initialized once; SDL keeps its device
+        list current through hotplug events, so it is never re-enumerated.
 
         Returns:
             True if a controller was connected, False otherwise
         """
-        # Only reinitialize if we don't have a joystick and need to detect new ones
-        if not self.joystick:
-            pygame.joystick.quit()
-            pygame.joystick.init()
-
         count = pygame.joystick.get_count()
-        print(f"[Controller] Detected {count} controller(s)")
+        log.info("[Controller] Detected %d controller(s)", count)
 
         if count > 0:
             # Try to find a PlayStation or generic controller
@@ -119,43 +291,27 @@ class InputHandler:
                     joystick = pygame.joystick.Joystick(i)
                     joystick.init()
                     name = joystick.get_name()
-                    name_lower = name.lower()
-
-                    # Log detailed controller information
-                    print(f"[Controller {i}] Name: {name}")
-                    print(f"[Controller {i}] GUID: {joystick.get_guid()}")
-                    print(f"[Controller {i}] Buttons: {joystick.get_numbuttons()}")
-                    print(f"[Controller {i}] Axes: {joystick.get_numaxes()}")
-                    print(f"[Controller {i}] Hats: {joystick.get_numhats()}")
-
-                    # Expanded list of PlayStation controller identifiers
-                    # Covers USB, Bluetooth, and various OS/driver combinations
-                    ps_identifiers = [
-                        'playstation',
-                        'ps4', 'ps5',
-                        'dualshock', 'dualsense',
-                        'wireless controller',
-                        'ps4 controller',
-                        'ps5 controller',
-                        'sony interactive entertainment',
-                        'sony computer entertainment',
-                        'cuh-zct',  # PS4 controller model numbers
-                        'cfI-zct',  # PS5 controller model numbers
-                        '054c:05c4',  # PS4 USB vendor:product ID
-                        '054c:09cc',  # PS4 Bluetooth vendor:product ID
-                        '054c:0ce6',  # PS5 vendor:product ID
-                    ]
+
+                    # Log detailed controller information (skips the SDL
+                    # queries entirely unless debug logging is on)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("[Controller %d] Name: %s", i, name)
+                        log.debug("[Controller %d] GUID: %s", i, joystick.get_guid())
+                        log.debug("[Controller %d] Buttons: %d", i, joystick.get_numbuttons())
+                        log.debug("[Controller %d] Axes: %d", i, joystick.get_numaxes())
+                        log.debug("[Controller %d] Hats: %d", i, joystick.get_numhats())
 
                     # Check if it's a PlayStation controller
-                    if any(ps_id in name_lower for ps_id in ps_identifiers):
+                    if self._is_playstation_name(name):
                         self.joystick = joystick
+                        self._cache_capabilities()
                         self.state.connected = True
                         self.state.controller_name = name
-                        print(f"[Controller] ✓ Connected to PlayStation controller: {name}")
+                        log.info("[Controller] ✓ Connected to PlayStation controller: %s", name)
                         self._log_button_test()
                         return True
                 except pygame.error as e:
-                    print(f"[Controller {i}] Error initializing: {e}")
+                    log.warning("[Controller %d] Error initializing: %s", i, e)
                     continue
 
             # If no PlayStation controller found, use the first available
@@ -163,213 +319,448 @@ class InputHandler:
             try:
                 self.joystick = pygame.joystick.Joystick(0)
                 self.joystick.init()
+                self._cache_capabilities()
                 self.state.connected = True
                 self.state.controller_name = self.joystick.get_name()
-                print(f"[Controller] ✓ Connected to generic controller: {self.state.controller_name}")
+                log.info("[Controller] ✓ Connected to generic controller: %s", self.state.controller_name)
                 self._log_button_test()
                 return True
             except pygame.error as e:
-                print(f"[Controller] Error connecting to first controller: {e}")
+                log.warning("[Controller] Error connecting to first controller: %s", e)
+
+        log.info("[Controller] No controllers detected")
+        self._disconnect()
+        return False
 
-        print("[Controller] No controllers detected")
+    def _disconnect(self):
+        """Forget the active controller and clear its state."""
+        self.joystick = None
+        self._cache_capabilities()
         self.state.connected = False
         self.state.controller_name = ""
-        return False
+
+    def _is_playstation_name(self, name: str) -> bool:
+        """
+        Check whether a controller name identifies a PlayStation controller.
+
+        Args:
+            name: Controller name reported by SDL
+
+        Returns:
+            True if the name matches a known PlayStation identifier
+        """
+        is_ps = self._ps_name_cache.get(name)
+        if is_ps is None:
+            is_ps = self._PS_NAME_RE.search(name.lower()) is not None
+            self._ps_name_cache[name] = is_ps
+        return is_ps
 
     def check_controller_connection(self) -> bool:
         """
         Check and update controller connection status.
-        Only checks if the joystick instance is still valid, doesn't reinitialize.
+        The connection is tracked from hotplug events (see handle_device_event),
+        so a connected controller is not re-queried here.
 
         Returns:
             True if a controller is connected
         """
-        # Check if we have a valid joystick
-        if self.joystick:
-            try:
-                # Try to get the joystick count to verify it's still valid
-                # This doesn't require reinitializing the subsystem
-                if pygame.joystick.get_count() > 0:
-                    # Verify our joystick is still valid by checking button count
-                    self.joystick.get_numbuttons()
-                    return True
-            except pygame.error:
-                # Joystick is no longer valid
-                print("Controller disconnected")
-                self.joystick = None
-                self.state.connected = False
-                self.state.controller_name = ""
-                return False
-
-        # No joystick or it was invalidated - try to connect
+        self._ensure_joystick()
+        if self.state.connected:
+            return True
+
+        # No joystick - try to connect
         return self._connect_controller()
 
+    def handle_device_event(self, event: pygame.event.Event) -> bool:
+        """
+        Update the connection from a JOYDEVICEADDED/JOYDEVICEREMOVED event.
+
+        Args:
+            event: The hotplug event
+
+        Returns:
+            True if the connected state changed
+        """
+        self._ensure_joystick()
+        was_connected = self.state.connected
+
+        if event.type == pygame.JOYDEVICEADDED:
+            if not was_connected:
+                self._connect_controller()
+
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            if event.instance_id == self._instance_id:
+                log.info("[Controller] Controller disconnected")
+                self._disconnect()
+                # Fall back to any other controller that is still attached
+                if pygame.joystick.get_count() > 0:
+                    self._connect_controller()
+
+        return self.state.connected != was_connected
+
+    def _cache_capabilities(self):
+        """
+        Cache the active controller's capabilities, which never change while
+        it stays connected, and clear any state left from a previous one.
+        """
+        joystick = self.joystick
+        if joystick:
+            self._num_buttons = joystick.get_numbuttons()
+            self._num_axes = joystick.get_numaxes()
+            self._num_hats = joystick.get_numhats()
+            self._instance_id = joystick.get_instance_id()
+            self._read_raw_input = self._read_keyboard_and_pad
+        else:
+            self._num_buttons = 0
+            self._num_axes = 0
+            self._num_hats = 0
+            self._instance_id = -1
+            self._read_raw_input = self._read_keyboard_only
+        self._reset_pad_state()
+
+    def _reset_pad_state(self):
+        """Clear cached controller button, axis and hat state."""
+        self._buttons_down = 0
+        self._axes = array.array('f', bytes(4 * self.MAX_AXES))
+        self._stick_action = None
+        self._hat = (0, 0)
+
+    def _update_axis(self, axis: int, value: float):
+        """
+        Store an axis reading, updating the left-stick direction if it moved.
+
+        Args:
+            axis: The axis index (below MAX_AXES)
+            value: The axis position (-1.0 to 1.0)
+        """
+        self._axes[axis] = value
+        if axis == self.PS_AXIS_LEFT_X or axis == self.PS_AXIS_LEFT_Y:
+            self._update_stick()
+
+    def _update_stick(self):
+        """
+        Resolve the left stick to a direction using a circular deadzone.
+        The stick must pass deadzone + AXIS_HYSTERESIS to activate and drop
+        below deadzone - AXIS_HYSTERESIS to release; the dominant axis picks
+        the direction, vertical winning exact diagonals like the D-pad.
+        """
+        axes = self._axes
+        axis_x = axes[self.PS_AXIS_LEFT_X]
+        axis_y = axes[self.PS_AXIS_LEFT_Y]
+        mag_sq = axis_x * axis_x + axis_y * axis_y
+
+        if self._stick_action is None:
+            if mag_sq <= self._stick_on_sq:
+                # Noise around a centred stick changes nothing
+                return
+        elif mag_sq < self._stick_off_sq:
+            self._stick_action = None
+            return
+
+        if abs(axis_y) >= abs(axis_x):
+            self._stick_action = _UP if axis_y < 0 else _DOWN
+        else:
+            self._stick_action = _LEFT if axis_x < 0 else _RIGHT
+
+    def handle_event(self, event: pygame.event.Event):
+        """
+        Update held input state from an SDL event.
+        The owner of the event loop should pass every event it drains here.
+
+        Args:
+            event: A pygame event
+        """
+        etype = event.type
+        if etype not in self._INPUT_EVENT_SET:
+            return
+
+        # Prefer the time SDL stamped on the event, shifted from SDL ticks
+        # onto the monotonic clock; pygame builds without event timestamps
+        # fall back to the time it was handled
+        event_time = time.monotonic_ns()
+        sdl_time = event.dict.get('timestamp')
+        if sdl_time:
+            event_time -= max(0, pygame.time.get_ticks() - sdl_time) * 1_000_000
+        self._last_event_time = event_time
+
+        if etype == pygame.KEYDOWN:
+            self._keys_down.add(event.key)
+        elif etype == pygame.KEYUP:
+            self._keys_down.discard(event.key)
+        else:
+            # Ignore events from controllers other than the active one
+            if event.instance_id != self._instance_id:
+                return
+
+            if etype == pygame.JOYBUTTONDOWN:
+                self._buttons_down |= 1 << event.button
+            elif etype == pygame.JOYBUTTONUP:
+                self._buttons_down &= ~(1 << event.button)
+            elif etype == pygame.JOYHATMOTION:
+                if event.hat == self.DPAD_HAT:
+                    self._hat = event.value
+            elif event.axis < self.MAX_AXES:
+                self._update_axis(event.axis, event.value)
+
+    def handle_events(self, events: List[pygame.event.Event]):
+        """
+        Update held input state from a batch of SDL events.
+        Stick and hat motion only matters for where it ends up, so just the
+        last motion event per axis or hat is applied. Key and button events
+        are all applied in order, so presses and releases pair up correctly.
+
+        Args:
+            events: Pygame events, in queue order
+        """
+        latest_motion = {}
+        for event in events:
+            etype = event.type
+            if etype == pygame.JOYAXISMOTION:
+                latest_motion[(event.instance_id, etype, event.axis)] = event
+            elif etype == pygame.JOYHATMOTION:
+                latest_motion[(event.instance_id, etype, event.hat)] = event
+            else:
+                self.handle_event(event)
+
+        for event in latest_motion.values():
+            self.handle_event(event)
+
+    def pump(self):
+        """
+        Drain pending input events from the SDL queue in one batch.
+        Only needed when nothing else is running an event loop.
+
+        This must run on the thread that owns the window: SDL only supports
+        pumping events there, so input is not polled from a worker thread.
+        Device reads already happen off the main thread when the
+        SDL_JOYSTICK_THREAD hint is set (see GameLauncher).
+        """
+        # One explicit pump, then a single non-pumping batch read
+        pygame.event.pump()
+        self.handle_events(pygame.event.get(self.INPUT_EVENT_TYPES, pump=False))
+
+    def _poll_pad_state(self):
+        """Refresh cached controller state by querying the device directly."""
+        joystick = self.joystick
+        if self._num_hats > 0:
+            self._hat = joystick.get_hat(self.DPAD_HAT)
+        for axis in range(min(self._num_axes, self.MAX_AXES)):
+            self._update_axis(axis, joystick.get_axis(axis))
+        buttons_down = 0
+        for btn in range(self._num_buttons):
+            if joystick.get_button(btn):
+                buttons_down |= 1 << btn
+        self._buttons_down = buttons_down
+
+    def _log_pressed_buttons(self):
+        """Log the held buttons whenever the set changes (debug_buttons only)."""
+        buttons_down = self._buttons_down
+        pressed_buttons = tuple(btn for btn in range(buttons_down.bit_length())
+                                if buttons_down >> btn & 1)
+        if pressed_buttons and pressed_buttons != self._last_pressed_buttons:
+            log.info("[Controller] Button(s) pressed: %s", list(pressed_buttons))
+        self._last_pressed_buttons = pressed_buttons
+
     def _log_button_test(self):
         """Log a test of button mappings for debugging."""
-        if not self.joystick:
+        if not self.joystick or not log.isEnabledFor(logging.DEBUG):
             return
 
-        try:
-            print(f"[Controller] Button mapping test:")
-            print(f"[Controller]   Expected Cross (confirm): Button {self.PS_BUTTON_CROSS}")
-            print(f"[Controller]   Expected Circle (back): Button {self.PS_BUTTON_CIRCLE}")
-            print(f"[Controller]   Expected Triangle (rescan): Button {self.PS_BUTTON_TRIANGLE}")
-            print(f"[Controller]   Expected Options: Button {self.PS_BUTTON_OPTIONS}")
-            print(f"[Controller] Press buttons to verify mapping...")
-        except Exception as e:
-            print(f"[Controller] Error in button test: {e}")
+        log.debug("[Controller] Button mapping test:")
+        log.debug("[Controller]   Expected Cross (confirm): Button %d", self.PS_BUTTON_CROSS)
+        log.debug("[Controller]   Expected Circle (back): Button %d", self.PS_BUTTON_CIRCLE)
+        log.debug("[Controller]   Expected Triangle (rescan): Button %d", self.PS_BUTTON_TRIANGLE)
+        log.debug("[Controller]   Expected Options: Button %d", self.PS_BUTTON_OPTIONS)
+        log.debug("[Controller] Press buttons to verify mapping...")
 
-    def get_input(self) -> InputAction:
+    def get_input(self, now: Optional[int] = None) -> InputAction:
         """
         Get the current input action from controller or keyboard.
         Handles input repeat for held directions.
 
+        Args:
+            now: Frame time from time.monotonic_ns(), so repeat timing uses
+                 the same clock reading as the rest of the frame. Read here
+                 if omitted
+
         Returns:
             The current InputAction
         """
-        current_time = pygame.time.get_ticks()
+        if not self._joystick_ready:
+            self._ensure_joystick()
+
+        if self.poll_input:
+            # Menus don't need more than ~125Hz; skip the device queries if
+            # called again too soon. NONE (not the previous action) is
+            # returned so a held direction isn't triggered twice
+            if now is None:
+                now = time.monotonic_ns()
+            if now - self._last_poll_time < self._poll_interval_ns:
+                return _NONE
+            self._last_poll_time = now
+
         action = self._read_raw_input()
 
-        # Handle input repeat logic
-        if action != InputAction.NONE:
-            if action != self._last_action:
-                # New action - trigger immediately
-                self._last_action = action
-                self._action_start_time = current_time
+        if action is _NONE:
+            # Nothing held (the common case) - nothing to reset, so the
+            # clock isn't read
+            if self._last_action is _NONE:
+                return _NONE
+
+            # Only the release is debounced: the action stays current until
+            # it has been released for RELEASE_DEBOUNCE, so a bounce back to
+            # the same input continues the hold instead of pressing again
+            current_time = time.monotonic_ns() if now is None else now
+            if self._release_time is None:
+                if self.poll_input:
+                    self._release_time = current_time
+                else:
+                    self._release_time = min(self._last_event_time, current_time)
+            if current_time - self._release_time >= self._release_debounce_ns:
+                self._last_action = _NONE
+                self._release_time = None
+            return _NONE
+
+        self._release_time = None
+        current_time = time.monotonic_ns() if now is None else now
+
+        if action is not self._last_action:
+            # New action - trigger on the press itself, timing the hold from
+            # the input event that caused it rather than from this frame
+            if self.poll_input:
+                start_time = current_time
+            else:
+                start_time = min(self._last_event_time, current_time)
+            self._last_action = action
+            self._action_start_time = start_time
+            self._last_repeat_time = start_time
+            return action
+
+        # Same action held - check for repeat
+        if current_time - self._action_start_time >= self._repeat_delay_ns:
+            if current_time - self._last_repeat_time >= self._repeat_interval_ns:
                 self._last_repeat_time = current_time
-                self._action_triggered = True
                 return action
-            else:
-                # Same action held
-                if not self._action_triggered:
-                    self._action_triggered = True
-                    return action
 
-                # Check for repeat
-                time_held = current_time - self._action_start_time
-                if time_held >= self.repeat_delay:
-                    time_since_repeat = current_time - self._last_repeat_time
-                    if time_since_repeat >= self.repeat_interval:
-                        self._last_repeat_time = current_time
-                        return action
-        else:
-            # No action - reset state
-            self._last_action = InputAction.NONE
-            self._action_triggered = False
+        return _NONE
 
-        return InputAction.NONE
+    def _read_keyboard_only(self) -> InputAction:
+        """
+        Read raw input from the cached keyboard state.
+        Serves as _read_raw_input while no controller is connected.
 
-    def _read_raw_input(self) -> InputAction:
+        Returns:
+            The detected InputAction
         """
-        Read raw input from controller and keyboard.
+        if self.poll_input:
+            keys = pygame.key.get_pressed()
+            for key, action in self.KEY_BINDINGS:
+                if keys[key]:
+                    return action
+        elif self._keys_down:
+            # Usually only one or two keys are held, so rank those rather
+            # than scanning the whole binding table
+            key_ranks = self._KEY_RANKS
+            best = None
+            for key in self._keys_down:
+                ranked = key_ranks.get(key)
+                if ranked is not None and (best is None or ranked[0] < best[0]):
+                    best = ranked
+            if best is not None:
+                return best[1]
+
+        return _NONE
+
+    def _read_keyboard_and_pad(self) -> InputAction:
+        """
+        Read raw input from the cached keyboard and controller state.
         Keyboard input has priority and is checked first.
+        Serves as _read_raw_input while a controller is connected.
 
         Returns:
             The detected InputAction
         """
         # Check keyboard input FIRST - keyboard always takes priority
         # This ensures keyboard works even when controller is connected
-        keys = pygame.key.get_pressed()
-
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            return InputAction.UP
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            return InputAction.DOWN
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            return InputAction.LEFT
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            return InputAction.RIGHT
-        if keys[pygame.K_RETURN] or keys[pygame.K_SPACE]:
-            return InputAction.CONFIRM
-        if keys[pygame.K_ESCAPE] or keys[pygame.K_BACKSPACE]:
-            return InputAction.BACK
-        if keys[pygame.K_TAB] or keys[pygame.K_o]:
-            return InputAction.OPTIONS
-        if keys[pygame.K_r]:
-            return InputAction.RESCAN
+        action = self._read_keyboard_only()
+        if action is not _NONE:
+            return action
 
         # Only check controller input if no keyboard input was detected
         # This prevents controller drift from interfering with keyboard
-        if self.joystick and self.state.connected:
+        if self.poll_input:
             try:
-                # Check D-pad (hat)
-                if self.joystick.get_numhats() > 0:
-                    hat = self.joystick.get_hat(self.DPAD_HAT)
-                    if hat[1] == 1:  # Up
-                        return InputAction.UP
-                    if hat[1] == -1:  # Down
-                        return InputAction.DOWN
-                    if hat[0] == -1:  # Left
-                        return InputAction.LEFT
-                    if hat[0] == 1:  # Right
-                        return InputAction.RIGHT
-
-                # Check left analog stick
-                if self.joystick.get_numaxes() >= 2:
-                    axis_x = self.joystick.get_axis(self.PS_AXIS_LEFT_X)
-                    axis_y = self.joystick.get_axis(self.PS_AXIS_LEFT_Y)
-
-                    if axis_y < -self.deadzone:
-                        return InputAction.UP
-                    if axis_y > self.deadzone:
-                        return InputAction.DOWN
-                    if axis_x < -self.deadzone:
-                        return InputAction.LEFT
-                    if axis_x > self.deadzone:
-                        return InputAction.RIGHT
-
-                # Check buttons
-                if self.joystick.get_numbuttons() > 0:
-                    # Check for any button press and log for debugging
-                    pressed_buttons = []
-                    for btn in range(self.joystick.get_numbuttons()):
-                        if self.joystick.get_button(btn):
-                            pressed_buttons.append(btn)
-
-                    # Log button presses for debugging (only when buttons are pressed)
-                    if pressed_buttons and not hasattr(self, '_last_pressed_buttons'):
-                        print(f"[Controller] Button(s) pressed: {pressed_buttons}")
-                    self._last_pressed_buttons = pressed_buttons if pressed_buttons else []
-
-                    if self._is_button_pressed(self.PS_BUTTON_CROSS):
-                        return InputAction.CONFIRM
-                    if self._is_button_pressed(self.PS_BUTTON_CIRCLE):
-                        return InputAction.BACK
-                    if self._is_button_pressed(self.PS_BUTTON_OPTIONS):
-                        return InputAction.OPTIONS
-                    if self._is_button_pressed(self.PS_BUTTON_TRIANGLE):
-                        return InputAction.RESCAN
-
+                self._poll_pad_state()
             except pygame.error:
                 # Controller may have been disconnected
-                self.state.connected = False
+                log.info("[Controller] Controller disconnected")
+                self._disconnect()
+                return _NONE
+
+        # Check D-pad (hat)
+        action = _HAT_ACTIONS.get(self._hat)
+        if action is not None:
+            return action
+
+        # Check left analog stick (resolved as its axes moved)
+        action = self._stick_action
+        if action is not None:
+            return action
+
+        # Check buttons
+        if self._num_buttons > 0:
+            # Collecting every held button is only needed for mapping diagnostics
+            if self.debug_buttons:
+                self._log_pressed_buttons()
+
+            buttons_down = self._buttons_down
+            if buttons_down:
+                for mask, action in self._button_actions:
+                    if buttons_down & mask:
+                        return action
 
-        return InputAction.NONE
+        return _NONE
 
-    def _is_button_pressed(self, button_id: int) -> bool:
-        """
-        Check if a specific button is pressed.
+    # Rebound per instance by _cache_capabilities() so the keyboard-only
+    # case never touches controller state
+    _read_raw_input = _read_keyboard_only
 
-        Args:
-            button_id: The button ID to check
+    def is_input_held(self) -> bool:
+        """
+        Check whether an action is being held, so get_input() may repeat it.
 
         Returns:
-            True if the button is pressed
+            True if the last action read is still held
         """
-        try:
-            if self.joystick and button_id < self.joystick.get_numbuttons():
-                return self.joystick.get_button(button_id)
-        except pygame.error:
-            pass
-        return False
+        return self._last_action is not _NONE
 
     def wait_for_release(self):
-        """Wait for all inputs to be released."""
-        while self._read_raw_input() != InputAction.NONE:
-            pygame.event.pump()
-            pygame.time.wait(10)
-        self._last_action = InputAction.NONE
-        self._action_triggered = False
+        """
+        Wait for all inputs to be released.
+        Blocks on the SDL event queue rather than polling on a timer.
+        """
+        # Device state only changes through events, so a long timeout costs
+        # nothing; poll_input mode needs regular wakeups to re-read devices
+        timeout = 50 if self.poll_input else 200
+
+        deferred = []
+        while self._read_raw_input() is not _NONE:
+            event = pygame.event.wait(timeout)
+            etype = event.type
+            if etype in self._INPUT_EVENT_SET:
+                self.handle_event(event)
+            elif etype != pygame.NOEVENT:
+                if etype == pygame.JOYDEVICEREMOVED and event.instance_id == self._instance_id:
+                    # Its buttons will never report a release
+                    self._reset_pad_state()
+                deferred.append(event)
+
+        # Hand unrelated events (quit, hotplug, ...) back to the main loop
+        for event in deferred:
+            pygame.event.post(event)
+
+        self._last_action = _NONE
+        self._release_time = None
 
     def get_controller_state(self) -> ControllerState:
         """
@@ -380,41 +771,31 @@ class InputHandler:
         """
         return self.state
 
-    def get_button_prompts(self) -> Dict[str, str]:
+    def get_button_prompts(self) -> ButtonPrompts:
         """
         Get the appropriate button prompt labels based on input method.
 
         Returns:
-            Dictionary mapping actions to button labels
+            Shared, immutable button labels for the current input method
         """
         if self.state.connected:
-            return {
-                'confirm': '✕',
-                'back': '○',
-                'options': 'OPTIONS',
-                'rescan': '△',
-                'navigate': 'D-Pad/L-Stick'
-            }
-        else:
-            return {
-                'confirm': 'Enter',
-                'back': 'Esc',
-                'options': 'Tab',
-                'rescan': 'R',
-                'navigate': 'Arrow Keys'
-            }
+            return self._PROMPTS_CONTROLLER
+        return self._PROMPTS_KEYBOARD
 
     def cleanup(self):
         """Clean up controller resources."""
+        # Only release our device; pygame.quit() shuts the subsystem down
         if self.joystick:
             self.joystick.quit()
-        pygame.joystick.quit()
+            self.joystick = None
 
 
 class InputEvent:
     """Represents a single input event for event-based handling."""
 
+    __slots__ = ('action', 'source', 'timestamp')
+
     def __init__(self, action: InputAction, source: str = "unknown"):
         self.action = action
         self.source = source  # "controller" or "keyboard"
-        self.timestamp = time.time()
+        self.timestamp = time.monotonic_ns()  # monotonic, unaffected by clock changes
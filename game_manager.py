@@ -6,85 +6,189 @@ Handles scanning for games, extracting icons, and managing the game cache.
 import os
 import json
 import hashlib
+import re
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-import pygame
+from functools import lru_cache
+from operator import attrgetter
+
+# pywin32 only exists on Windows; don't search for it anywhere else
+HAS_WIN32 = False
+if sys.platform == 'win32':
+    try:
+        import win32api
+        import win32con
+        import win32gui
+        import win32ui
+        HAS_WIN32 = True
+    except ImportError:
+        print("Warning: win32 libraries not available. Icon extraction will be limited.")
 
 try:
-    import win32api
-    import win32con
-    import win32gui
-    import win32ui
     from PIL import Image
-    HAS_WIN32 = True
+    HAS_PIL = True
 except ImportError:
-    HAS_WIN32 = False
-    print("Warning: win32 libraries not available. Icon extraction will be limited.")
+    HAS_PIL = False
 
 try:
-    from PIL import Image
-    HAS_PIL = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_PIL = False
+    HAS_ORJSON = False
+
+
+@lru_cache(maxsize=8192)
+def _path_hash(path: str) -> str:
+    """
+    Short stable identifier for a game path, shared by the game's hash_id
+    and its icon file name.
+
+    MD5 is kept (rather than a faster hash) because the value names files
+    and cache entries from earlier scans; the cache makes repeat lookups
+    for the same path free.
+
+    Args:
+        path: Path to the game executable
+
+    Returns:
+        12-character hex identifier
+    """
+    return hashlib.md5(path.encode()).hexdigest()[:12]
 
 
-@dataclass
+# Words in a folder name: separators split words, as do camelCase humps
+# ("CommonRedist" -> common, redist) and letter/digit changes
+_WORD_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+_PATH_SEP_RE = re.compile(r'[\\/]')
+
+
+@lru_cache(maxsize=4096)
+def _folder_words(folder: str) -> frozenset:
+    """
+    Lowercased words and whole component names of a folder path.
+    Executables in the same folder share the result.
+
+    Args:
+        folder: Folder path
+
+    Returns:
+        Set of lowercased words and path components
+    """
+    words = set()
+    for part in _PATH_SEP_RE.split(folder):
+        if part:
+            words.add(part.lower())
+            words.update(word.lower() for word in _WORD_RE.findall(part))
+    return frozenset(words)
+
+
+@dataclass(slots=True)
 class Game:
     """Represents a detected game."""
     name: str
     path: str
     icon_path: Optional[str] = None
-    poster_path: Optional[str] = None
-    background_path: Optional[str] = None
     folder_source: str = ""
     last_played: Optional[str] = None
     play_count: int = 0
     is_shortcut: bool = False
     hash_id: str = ""
+    # Poster/background art, detected from the images_ folder on first
+    # access (see the poster_path/background_path properties)
+    _poster_path: Optional[str] = field(default=None, repr=False)
+    _background_path: Optional[str] = field(default=None, repr=False)
+    _images_detected: bool = field(default=False, repr=False, compare=False)
+    # Casefolded name for sorting, computed once rather than per comparison
+    _sort_key: str = field(default="", init=False, repr=False, compare=False)
+
+    # Supported image extensions (including AVIF), in order of preference
+    IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.avif', '.heic', '.heif')
+    _IMAGE_EXT_RANK = {ext: rank for rank, ext in enumerate(IMAGE_EXTENSIONS)}
 
     def __post_init__(self):
         if not self.hash_id:
-            self.hash_id = hashlib.md5(self.path.encode()).hexdigest()[:12]
-        # Auto-detect poster and background from images_ folder
-        self._detect_images()
+            self.hash_id = _path_hash(self.path)
+        self._sort_key = self.name.casefold()
+
+    @property
+    def poster_path(self) -> Optional[str]:
+        """Poster image from the images_ folder, if any."""
+        if not self._images_detected:
+            self._detect_images()
+        return self._poster_path
+
+    @property
+    def background_path(self) -> Optional[str]:
+        """Background image from the images_ folder, if any."""
+        if not self._images_detected:
+            self._detect_images()
+        return self._background_path
 
     def _detect_images(self):
         """Detect poster and background images from the images_ folder."""
+        self._images_detected = True
         if not self.path:
             return
 
         game_dir = os.path.dirname(self.path)
         images_folder = os.path.join(game_dir, "images_")
 
-        if os.path.exists(images_folder):
-            # Supported image extensions (including AVIF)
-            image_extensions = ['.png', '.jpg', '.jpeg', '.webp', '.bmp', '.avif', '.heic', '.heif']
-
-            # Look for poster image
-            for ext in image_extensions:
-                poster_file = os.path.join(images_folder, f"poster{ext}")
-                if os.path.exists(poster_file):
-                    self.poster_path = poster_file
-                    break
+        # Read the folder once rather than probing every name/extension pair,
+        # keeping the most preferred extension for each image
+        found = {}
+        try:
+            with os.scandir(images_folder) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name.lower())
+                    rank = self._IMAGE_EXT_RANK.get(ext)
+                    if rank is None or stem not in ('poster', 'background'):
+                        continue
+                    if stem not in found or rank < found[stem][0]:
+                        found[stem] = (rank, entry.path)
+        except OSError:
+            # No images_ folder
+            return
 
-            # Look for background image
-            for ext in image_extensions:
-                bg_file = os.path.join(images_folder, f"background{ext}")
-                if os.path.exists(bg_file):
-                    self.background_path = bg_file
-                    break
+        if 'poster' in found:
+            self._poster_path = found['poster'][1]
+        if 'background' in found:
+            self._background_path = found['background'][1]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # All fields are plain values, so skip asdict()'s recursive deep copy
+        return {
+            'name': self.name,
+            'path': self.path,
+            'icon_path': self.icon_path,
+            # Last known art; saving doesn't force detection
+            'poster_path': self._poster_path,
+            'background_path': self._background_path,
+            'folder_source': self.folder_source,
+            'last_played': self.last_played,
+            'play_count': self.play_count,
+            'is_shortcut': self.is_shortcut,
+            'hash_id': self.hash_id,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Game':
         """Create a Game instance from a dictionary."""
-        return cls(**data)
+        # Cached art paths seed the lazy image fields; images_ is still
+        # re-checked when they are first used. Ignore keys this version
+        # doesn't know (e.g. from a newer cache)
+        kwargs = {_CACHED_FIELD_ALIASES.get(k, k): v for k, v in data.items()}
+        return cls(**{k: v for k, v in kwargs.items() if k in _GAME_FIELDS})
+
+
+_GAME_FIELDS = frozenset(f.name for f in fields(Game) if f.init)
+_CACHED_FIELD_ALIASES = {'poster_path': '_poster_path', 'background_path': '_background_path'}
 
 
 class GameManager:
@@ -106,6 +210,40 @@ class GameManager:
         'game', 'play', 'start', 'launch', 'run', 'main', 'win64', 'win32'
     ]
 
+    # Both pattern lists compiled into single case-insensitive scans
+    _IGNORE_RE = re.compile('|'.join(map(re.escape, IGNORED_PATTERNS)), re.IGNORECASE)
+    _GAME_RE = re.compile('|'.join(map(re.escape, GAME_PATTERNS)), re.IGNORECASE)
+    _IGNORED_WORDS = frozenset(p.lower() for p in IGNORED_PATTERNS)
+
+    # Build/architecture suffixes stripped from game names
+    NAME_SUFFIXES = [
+        '-Win64-Shipping', '-Win32-Shipping', '_x64', '_x86', '-x64', '-x86',
+        '_64', '_32', ' x64', ' x86', 'Win64', 'Win32'
+    ]
+
+    # One suffix at the end of a name (longest first), and runs of
+    # delimiters/whitespace to collapse into single spaces
+    _NAME_SUFFIX_RE = re.compile(
+        '(?:' + '|'.join(map(re.escape, sorted(NAME_SUFFIXES, key=len, reverse=True))) + ')$',
+        re.IGNORECASE)
+    _NAME_DELIM_RE = re.compile(r'[_\-\s]+')
+
+    # How many subfolder levels below a game folder are searched for executables
+    EXE_SEARCH_DEPTH = 2
+
+    # Game folders are searched on a thread pool (the walk is I/O bound) once
+    # a library folder has more than this many of them
+    PARALLEL_SCAN_MIN_FOLDERS = 4
+    MAX_SCAN_WORKERS = 32
+
+    # Cache format written by save_cache(), and the versions load_cache()
+    # accepts (1.0 caches lack the icon map but are otherwise the same)
+    CACHE_VERSION = '2.0'
+    COMPATIBLE_CACHE_VERSIONS = ('1.0', '2.0')
+
+    # Threads extracting icons in the background while a scan walks folders
+    ICON_WORKERS = 4
+
     def __init__(self, config: Dict[str, Any], cache_path: str = "games_cache.json"):
         """
         Initialize the game manager.
@@ -117,8 +255,22 @@ class GameManager:
         self.config = config
         self.cache_path = cache_path
         self.games: List[Game] = []
+        # (lowercased name, game) pairs for search_games(), and the games
+        # list they were built from
+        self._name_index: List[Tuple[str, Game]] = []
+        self._indexed_games: Optional[List[Game]] = None
+        # Sort order self.games is currently in; None once games or their
+        # play stats change
+        self._sorted_by: Optional[str] = None
         self.icons_dir = Path("assets/game_icons")
         self.icons_dir.mkdir(parents=True, exist_ok=True)
+        # Icon file key -> size|mtime of the executable it was extracted
+        # from, persisted in the cache
+        self._icon_cache: Dict[str, str] = {}
+        # Icon extraction pool and its outstanding (game, future) pairs,
+        # only set while scan_games() runs
+        self._icon_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_icons: List[Tuple[Game, Any]] = []
 
     def load_cache(self) -> bool:
         """
@@ -129,12 +281,21 @@ class GameManager:
         """
         try:
             if os.path.exists(self.cache_path):
-                with open(self.cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.games = [Game.from_dict(g) for g in data.get('games', [])]
-                    print(f"Loaded {len(self.games)} games from cache")
-                    return True
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+                with open(self.cache_path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                if data.get('version') not in self.COMPATIBLE_CACHE_VERSIONS:
+                    # Written by an incompatible version - rescan instead
+                    print(f"Ignoring cache with unsupported version {data.get('version')!r}")
+                    return False
+                self.games = [Game.from_dict(g) for g in data.get('games', [])]
+                self._sorted_by = None
+                self._icon_cache = data.get('icons', {})
+                self._index_names()
+                print(f"Loaded {len(self.games)} games from cache")
+                return True
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
             print(f"Error loading cache: {e}")
 
         return False
@@ -142,46 +303,106 @@ class GameManager:
     def save_cache(self):
         """Save games to cache file."""
         try:
+            # Only keep icons still in use by a game, deleting the rest
+            icon_paths = {g.icon_path for g in self.games if g.icon_path}
+            for icon_key in list(self._icon_cache):
+                icon_path = str(self.icons_dir / f"{icon_key}.png")
+                if icon_path not in icon_paths:
+                    del self._icon_cache[icon_key]
+                    try:
+                        os.remove(icon_path)
+                    except OSError:
+                        pass
             data = {
-                'version': '1.0',
+                'version': self.CACHE_VERSION,
                 'last_scan': datetime.now().isoformat(),
-                'games': [g.to_dict() for g in self.games]
+                'games': [g.to_dict() for g in self.games],
+                'icons': self._icon_cache
             }
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Compact output; the cache isn't meant to be hand-edited
+            if HAS_ORJSON:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+            # Write a temporary file and swap it in, so an interrupted save
+            # can't leave a truncated cache behind
+            tmp_path = f"{self.cache_path}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+            except OSError:
+                # Never promote a partial file; drop it and keep the old cache
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            os.replace(tmp_path, self.cache_path)
             print(f"Saved {len(self.games)} games to cache")
         except IOError as e:
             print(f"Error saving cache: {e}")
 
-    def scan_games(self, folders: List[str], progress_callback: Optional[callable] = None) -> List[Game]:
+    def scan_games(self, folders: List[str], progress_callback: Optional[callable] = None,
+                   cancel: Optional[threading.Event] = None) -> List[Game]:
         """
         Scan folders for game executables.
+        Safe to run on a worker thread: self.games is only replaced once the
+        scan completes.
 
         Args:
             folders: List of folder paths to scan
             progress_callback: Optional callback for progress updates (message, progress 0-1)
+            cancel: Optional event; once set, the scan stops after the current
+                    folder and the previous game list is kept
 
         Returns:
             List of detected games
         """
-        self.games = []
+        games = []
         found_paths = set()
         total_folders = len([f for f in folders if os.path.exists(f)])
         scanned = 0
 
-        for folder in folders:
-            if not os.path.exists(folder):
-                print(f"Folder not found: {folder}")
-                continue
+        # Icons are extracted on a small pool while the folders are walked
+        use_icon_pool = HAS_WIN32 and HAS_PIL
+        if use_icon_pool:
+            self._icon_pool = ThreadPoolExecutor(max_workers=self.ICON_WORKERS)
 
-            if progress_callback:
-                progress_callback(f"Scanning: {folder}", scanned / max(total_folders, 1))
+        try:
+            for folder in folders:
+                if cancel is not None and cancel.is_set():
+                    break
 
-            games_in_folder = self._scan_folder(folder, found_paths)
-            self.games.extend(games_in_folder)
-            scanned += 1
+                if not os.path.exists(folder):
+                    print(f"Folder not found: {folder}")
+                    continue
+
+                if progress_callback:
+                    progress_callback(f"Scanning: {folder}", scanned / max(total_folders, 1))
+
+                games_in_folder = self._scan_folder(folder, found_paths)
+                games.extend(games_in_folder)
+                scanned += 1
+
+            if cancel is not None and cancel.is_set():
+                for _, future in self._pending_icons:
+                    future.cancel()
+                print("Scan cancelled")
+                return self.games
+
+            # Wait for the remaining icons
+            if self._pending_icons and progress_callback:
+                progress_callback("Extracting icons...", 1.0)
+            for game, future in self._pending_icons:
+                game.icon_path = future.result()
+        finally:
+            self._pending_icons = []
+            if self._icon_pool:
+                self._icon_pool.shutdown()
+                self._icon_pool = None
 
         # Sort and save
+        self.games = games
+        self._sorted_by = None
         self._sort_games()
         self.save_cache()
 
@@ -202,12 +423,29 @@ class GameManager:
             List of games found in this folder
         """
         games = []
-        folder_path = Path(folder)
+        lnk_files = []
+        subfolders = []
+        exe_files = []
+        has_images = False  # whether the folder itself has an images_ subfolder
 
         try:
+            # Classify the folder's entries in a single directory read
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name_lower = entry.name.lower()
+                    if entry.is_dir():
+                        if entry.name == 'images_':
+                            has_images = True
+                        if not entry.name.startswith('.'):
+                            subfolders.append(entry)
+                    elif name_lower.endswith('.lnk'):
+                        lnk_files.append(entry.path)
+                    elif name_lower.endswith('.exe'):
+                        exe_files.append(entry.path)
+
             # First, look for .lnk shortcuts
-            for lnk_file in folder_path.glob("*.lnk"):
-                target = self._resolve_shortcut(str(lnk_file))
+            for lnk_file in lnk_files:
+                target = self._resolve_shortcut(lnk_file)
                 if target and target.lower().endswith('.exe') and target not in found_paths:
                     if not self._should_ignore(target):
                         found_paths.add(target)
@@ -215,19 +453,32 @@ class GameManager:
                         if game:
                             games.append(game)
 
-            # Scan subdirectories (typically each game is in its own folder)
-            for item in folder_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    # Look for main game executable in this subfolder
-                    game = self._find_game_in_folder(item, folder, found_paths)
+            # Scan subdirectories (typically each game is in its own folder),
+            # looking for the main game executable in each
+            folder_paths = [item.path for item in subfolders]
+            if len(folder_paths) > self.PARALLEL_SCAN_MIN_FOLDERS:
+                workers = min(self.MAX_SCAN_WORKERS, len(folder_paths), (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    best_exes = list(executor.map(self._find_game_exe, folder_paths))
+            else:
+                best_exes = [self._find_game_exe(path) for path in folder_paths]
+
+            # Entries are created here, in folder order, so duplicate
+            # detection and icon extraction stay on this thread
+            for item, best in zip(subfolders, best_exes):
+                if best and best[0] not in found_paths:
+                    exe_path, exe_has_images = best
+                    found_paths.add(exe_path)
+                    game = self._create_game_entry(exe_path, folder, folder_name=item.name,
+                                                   has_images=exe_has_images)
                     if game:
                         games.append(game)
 
             # Also check for executables directly in this folder
-            for exe_file in folder_path.glob("*.exe"):
-                if str(exe_file) not in found_paths and not self._should_ignore(str(exe_file)):
-                    found_paths.add(str(exe_file))
-                    game = self._create_game_entry(str(exe_file), folder)
+            for exe_file in exe_files:
+                if exe_file not in found_paths and not self._should_ignore(exe_file):
+                    found_paths.add(exe_file)
+                    game = self._create_game_entry(exe_file, folder, has_images=has_images)
                     if game:
                         games.append(game)
 
@@ -238,86 +489,104 @@ class GameManager:
 
         return games
 
-    def _find_game_in_folder(self, game_folder: Path, source_folder: str, found_paths: set) -> Optional[Game]:
+    def _walk_exes(self, root: str, max_depth: int, depth: int = 0,
+                   image_dirs: Optional[set] = None):
+        """
+        Yield the executables under a folder, without following symlinks.
+
+        Args:
+            root: Folder to search
+            max_depth: Deepest subfolder level to descend into
+            depth: Level of root below the starting folder
+            image_dirs: Optional set to collect the folders that contain an
+                        images_ subfolder
+
+        Yields:
+            Tuples of (DirEntry, depth) for each .exe file
+        """
+        subfolders = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if image_dirs is not None and entry.name == 'images_':
+                            image_dirs.add(root)
+                        if depth < max_depth:
+                            subfolders.append(entry.path)
+                    elif entry.name.lower().endswith('.exe'):
+                        yield entry, depth
+        except OSError:
+            # Unreadable folder (permissions, removed mid-scan) - skip it
+            return
+
+        for subfolder in subfolders:
+            yield from self._walk_exes(subfolder, max_depth, depth + 1, image_dirs)
+
+    def _find_game_exe(self, game_folder: str) -> Optional[Tuple[str, bool]]:
         """
         Find the main game executable in a game folder.
+        Safe to call from worker threads.
 
         Args:
             game_folder: Path to the game's folder
-            source_folder: The source folder being scanned
-            found_paths: Set of already found paths
 
         Returns:
-            Game object or None
+            Tuple of (path to the most likely game executable, whether its
+            folder has an images_ subfolder), or None
         """
-        exe_files = []
+        folder_lower = os.path.basename(game_folder).lower()
+        image_dirs = set()
 
-        try:
-            # Get all .exe files recursively (but not too deep)
-            for exe in game_folder.rglob("*.exe"):
-                # Limit depth
-                rel_path = exe.relative_to(game_folder)
-                if len(rel_path.parts) <= 3:  # Max 3 levels deep
-                    if not self._should_ignore(str(exe)):
-                        exe_files.append(exe)
-        except PermissionError:
-            return None
+        # Score each executable (but not too deep) to find the most likely game
+        scored_exes = []
+        for entry, _ in self._walk_exes(game_folder, self.EXE_SEARCH_DEPTH,
+                                        image_dirs=image_dirs):
+            if not self._should_ignore(entry.path):
+                score = self._score_executable(entry, folder_lower)
+                scored_exes.append((entry.path, score))
 
-        if not exe_files:
+        if not scored_exes:
             return None
 
-        # Score and sort executables to find the most likely game executable
-        scored_exes = []
-        for exe in exe_files:
-            score = self._score_executable(exe, game_folder.name)
-            scored_exes.append((exe, score))
-
         scored_exes.sort(key=lambda x: x[1], reverse=True)
 
         # Take the highest scored executable
-        best_exe = scored_exes[0][0]
-        exe_path = str(best_exe)
+        exe_path = scored_exes[0][0]
+        return exe_path, os.path.dirname(exe_path) in image_dirs
 
-        if exe_path in found_paths:
-            return None
-
-        found_paths.add(exe_path)
-        return self._create_game_entry(exe_path, source_folder, folder_name=game_folder.name)
-
-    def _score_executable(self, exe_path: Path, folder_name: str) -> int:
+    def _score_executable(self, exe_entry: os.DirEntry, folder_lower: str) -> int:
         """
         Score an executable to determine if it's likely the main game.
 
         Args:
-            exe_path: Path to the executable
-            folder_name: Name of the game folder
+            exe_entry: Directory entry of the executable, from _walk_exes
+            folder_lower: Lowercased name of the game folder
 
         Returns:
             Score (higher is better)
         """
         score = 0
-        name_lower = exe_path.stem.lower()
-        folder_lower = folder_name.lower()
+        name_lower = os.path.splitext(exe_entry.name)[0].lower()
 
         # Bonus if name matches folder name
         if name_lower in folder_lower or folder_lower in name_lower:
             score += 50
 
         # Bonus for being in root or bin folder
-        rel_parts = exe_path.parts
-        if len(rel_parts) <= 2:
+        if len(Path(exe_entry.path).parts) <= 2:
             score += 20
-        if 'bin' in str(exe_path).lower() or 'binaries' in str(exe_path).lower():
+        path_lower = exe_entry.path.lower()
+        if 'bin' in path_lower or 'binaries' in path_lower:
             score += 15
 
-        # Bonus for game-related patterns
-        for pattern in self.GAME_PATTERNS:
-            if pattern in name_lower:
-                score += 10
+        # Bonus for each game-related pattern in the name
+        score += 10 * len(set(self._GAME_RE.findall(name_lower)))
 
-        # Bonus for larger file size (games are usually larger)
+        # Bonus for larger file size (games are usually larger).
+        # DirEntry.stat() is cached, and free on Windows where the
+        # directory listing already carries the size
         try:
-            size = exe_path.stat().st_size
+            size = exe_entry.stat().st_size
             if size > 50 * 1024 * 1024:  # > 50MB
                 score += 30
             elif size > 10 * 1024 * 1024:  # > 10MB
@@ -328,9 +597,8 @@ class GameManager:
             pass
 
         # Penalty for common non-game patterns
-        for pattern in self.IGNORED_PATTERNS:
-            if pattern in name_lower:
-                score -= 100
+        if self._IGNORE_RE.search(name_lower):
+            score -= 100
 
         return score
 
@@ -344,17 +612,20 @@ class GameManager:
         Returns:
             True if should be ignored
         """
-        name_lower = Path(path).stem.lower()
-        path_lower = path.lower()
+        folder, file_name = os.path.split(path)
 
-        for pattern in self.IGNORED_PATTERNS:
-            if pattern in name_lower or pattern in path_lower:
-                return True
+        # Executable names often run words together ("unins000",
+        # "UnityCrashHandler64"), so match patterns anywhere in the name
+        if self._IGNORE_RE.search(file_name):
+            return True
 
-        return False
+        # Folders only match on whole words or names, so e.g. everything
+        # under "Games/Installed" or "Configurable" isn't skipped
+        return not self._IGNORED_WORDS.isdisjoint(_folder_words(folder))
 
     def _create_game_entry(self, exe_path: str, source_folder: str,
-                           folder_name: Optional[str] = None, is_shortcut: bool = False) -> Optional[Game]:
+                           folder_name: Optional[str] = None, is_shortcut: bool = False,
+                           has_images: Optional[bool] = None) -> Optional[Game]:
         """
         Create a game entry from an executable path.
 
@@ -363,6 +634,8 @@ class GameManager:
             source_folder: Source folder being scanned
             folder_name: Optional folder name to use for game name
             is_shortcut: Whether this came from a shortcut
+            has_images: Whether the executable's folder has an images_
+                        subfolder, if the scan already knows
 
         Returns:
             Game object or None
@@ -374,16 +647,26 @@ class GameManager:
             else:
                 name = self._clean_game_name(Path(exe_path).stem)
 
-            # Extract icon
-            icon_path = self._extract_icon(exe_path)
+            # Extract icon, in the background during a scan
+            if self._icon_pool:
+                icon_path = None
+                icon_future = self._icon_pool.submit(self._extract_icon, exe_path)
+            else:
+                icon_path = self._extract_icon(exe_path)
+                icon_future = None
 
-            return Game(
+            game = Game(
                 name=name,
                 path=exe_path,
                 icon_path=icon_path,
                 folder_source=source_folder,
-                is_shortcut=is_shortcut
+                is_shortcut=is_shortcut,
+                # No images_ folder means nothing to detect later
+                _images_detected=has_images is False
             )
+            if icon_future:
+                self._pending_icons.append((game, icon_future))
+            return game
         except Exception as e:
             print(f"Error creating game entry for {exe_path}: {e}")
             return None
@@ -398,21 +681,11 @@ class GameManager:
         Returns:
             Cleaned name
         """
-        # Remove common suffixes
-        suffixes = ['-Win64-Shipping', '-Win32-Shipping', '_x64', '_x86', '-x64', '-x86',
-                    '_64', '_32', ' x64', ' x86', 'Win64', 'Win32']
-        for suffix in suffixes:
-            if name.lower().endswith(suffix.lower()):
-                name = name[:-len(suffix)]
-
-        # Replace underscores and dashes with spaces
-        name = name.replace('_', ' ').replace('-', ' ')
+        # Remove a common suffix
+        name = self._NAME_SUFFIX_RE.sub('', name, count=1)
 
-        # Remove multiple spaces
-        while '  ' in name:
-            name = name.replace('  ', ' ')
-
-        return name.strip()
+        # Replace underscores, dashes and repeated spaces with single spaces
+        return self._NAME_DELIM_RE.sub(' ', name).strip()
 
     def _resolve_shortcut(self, lnk_path: str) -> Optional[str]:
         """
@@ -438,6 +711,10 @@ class GameManager:
     def _extract_icon(self, exe_path: str) -> Optional[str]:
         """
         Extract icon from an executable file.
+        Icons are named by the executable's path, and the size and
+        modification time they were extracted from are remembered, so a
+        patched game gets a fresh icon and an unchanged one is served from
+        the cache without touching the icon file.
 
         Args:
             exe_path: Path to the executable
@@ -450,50 +727,26 @@ class GameManager:
 
         try:
             # Generate unique filename for this icon
-            icon_hash = hashlib.md5(exe_path.encode()).hexdigest()[:12]
-            icon_filename = f"{icon_hash}.png"
-            icon_path = self.icons_dir / icon_filename
+            icon_key = _path_hash(exe_path)
+            icon_path = self.icons_dir / f"{icon_key}.png"
 
-            # Check if already extracted
-            if icon_path.exists():
+            # Already extracted from this version of the executable
+            st = os.stat(exe_path)
+            fingerprint = f"{st.st_size}|{st.st_mtime_ns}"
+            if self._icon_cache.get(icon_key) == fingerprint:
                 return str(icon_path)
 
-            # Extract icon using win32
+            # Extract icon using win32, replacing any icon from an older version
             large_icons, small_icons = win32gui.ExtractIconEx(exe_path, 0, 1, 1)
-
-            if large_icons:
-                icon_handle = large_icons[0]
-
-                # Create device context
-                hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
-                hbmp = win32ui.CreateBitmap()
-                hbmp.CreateCompatibleBitmap(hdc, 256, 256)
-                hdc_mem = hdc.CreateCompatibleDC()
-                hdc_mem.SelectObject(hbmp)
-
-                # Draw icon
-                win32gui.DrawIconEx(hdc_mem.GetHandleOutput(), 0, 0, icon_handle,
-                                    256, 256, 0, None, win32con.DI_NORMAL)
-
-                # Convert to PIL Image
-                bmpinfo = hbmp.GetInfo()
-                bmpstr = hbmp.GetBitmapBits(True)
-                img = Image.frombuffer('RGBA', (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                                       bmpstr, 'raw', 'BGRA', 0, 1)
-
-                # Save icon
-                img.save(str(icon_path), 'PNG')
-
-                # Cleanup
-                win32gui.DestroyIcon(icon_handle)
-                hdc_mem.DeleteDC()
-                hdc.DeleteDC()
-
-                return str(icon_path)
-
-            # Cleanup any extracted icons
-            for icon in large_icons + small_icons:
-                win32gui.DestroyIcon(icon)
+            try:
+                if large_icons:
+                    self._save_icon(large_icons[0], str(icon_path))
+                    self._icon_cache[icon_key] = fingerprint
+                    return str(icon_path)
+            finally:
+                # Cleanup every extracted icon, whether or not saving worked
+                for icon in large_icons + small_icons:
+                    win32gui.DestroyIcon(icon)
 
         except Exception as e:
             # Silently fail - we'll use default icon
@@ -501,19 +754,65 @@ class GameManager:
 
         return None
 
+    def _save_icon(self, icon_handle, icon_path: str):
+        """
+        Render an icon handle to a 256x256 PNG.
+
+        Args:
+            icon_handle: HICON to render (still owned by the caller)
+            icon_path: Where to save the PNG
+        """
+        # Create device context
+        screen_dc = win32gui.GetDC(0)
+        hdc = win32ui.CreateDCFromHandle(screen_dc)
+        hdc_mem = hdc.CreateCompatibleDC()
+        hbmp = win32ui.CreateBitmap()
+        try:
+            hbmp.CreateCompatibleBitmap(hdc, 256, 256)
+            hdc_mem.SelectObject(hbmp)
+
+            # Draw icon
+            win32gui.DrawIconEx(hdc_mem.GetHandleOutput(), 0, 0, icon_handle,
+                                256, 256, 0, None, win32con.DI_NORMAL)
+
+            # Convert to PIL Image
+            bmpinfo = hbmp.GetInfo()
+            bmpstr = hbmp.GetBitmapBits(True)
+            img = Image.frombuffer('RGBA', (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
+                                   bmpstr, 'raw', 'BGRA', 0, 1)
+
+            # Save icon
+            img.save(icon_path, 'PNG')
+        finally:
+            # Cleanup GDI objects even if drawing or saving failed
+            hdc_mem.DeleteDC()
+            win32gui.DeleteObject(hbmp.GetHandle())
+            win32gui.ReleaseDC(0, screen_dc)
+
     def _sort_games(self):
         """Sort games based on configuration."""
         sort_method = self.config.get('sorting', 'alphabetical')
+        if sort_method == self._sorted_by:
+            # Already in this order (and the name index is current)
+            return
 
         if sort_method == 'alphabetical':
-            self.games.sort(key=lambda g: g.name.lower())
+            self.games.sort(key=attrgetter('_sort_key'))
         elif sort_method == 'recent':
             self.games.sort(key=lambda g: g.last_played or '', reverse=True)
         elif sort_method == 'folder':
-            self.games.sort(key=lambda g: (g.folder_source, g.name.lower()))
+            self.games.sort(key=attrgetter('folder_source', '_sort_key'))
         elif sort_method == 'play_count':
             self.games.sort(key=lambda g: g.play_count, reverse=True)
 
+        self._sorted_by = sort_method
+        self._index_names()
+
+    def _index_names(self):
+        """Rebuild the lowercased name index used by search_games()."""
+        self._name_index = [(g.name.lower(), g) for g in self.games]
+        self._indexed_games = self.games
+
     def get_games(self, sort_by: Optional[str] = None) -> List[Game]:
         """
         Get the list of games, optionally sorted.
@@ -555,6 +854,7 @@ class GameManager:
         """
         game.last_played = datetime.now().isoformat()
         game.play_count += 1
+        self._sorted_by = None  # recent/play count order may have changed
         self.save_cache()
 
     def search_games(self, query: str) -> List[Game]:
@@ -567,8 +867,13 @@ class GameManager:
         Returns:
             List of matching games
         """
+        # self.games may have been replaced or resized without going
+        # through the manager
+        if self._indexed_games is not self.games or len(self._name_index) != len(self.games):
+            self._index_names()
+
         query_lower = query.lower()
-        return [g for g in self.games if query_lower in g.name.lower()]
+        return [game for name, game in self._name_index if query_lower in name]
 
     def get_game_count(self) -> int:
         """Get total number of games."""
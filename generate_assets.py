@@ -7,6 +7,7 @@ used by the game launcher.
 """
 
 import os
+import json
 from pathlib import Path
 
 try:
@@ -92,18 +93,18 @@ def create_default_icon(output_path: str, size: int = 256):
     print(f"Created: {output_path}")
 
 
-def create_button_icon(output_path: str, symbol: str, color: tuple, size: int = 64):
+def create_button_icon(symbol: str, color: tuple, size: int = 64) -> 'Image.Image':
     """
     Create a PlayStation-style button icon.
 
     Args:
-        output_path: Path to save the icon
         symbol: Symbol to draw (X, O, △, □)
         color: RGB color tuple
         size: Icon size
+
+    Returns:
+        The icon image
     """
-    if not HAS_PIL:
-        return
 
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -146,18 +147,43 @@ def create_button_icon(output_path: str, symbol: str, color: tuple, size: int =
         draw.rectangle([center - offset, center - offset, center + offset, center + offset],
                        outline=symbol_color, width=3)
 
-    img.save(output_path, 'PNG')
+    return img
+
+
+def create_button_atlas(output_path: str, manifest_path: str, buttons: list, size: int = 64):
+    """
+    Create a single sprite atlas of button icons plus a JSON manifest of
+    their rects, so they can be loaded with one file read.
+
+    Args:
+        output_path: Path to save the atlas image
+        manifest_path: Path to save the manifest ({name: [x, y, w, h]})
+        buttons: List of (name, symbol, color) tuples
+        size: Size of each icon
+    """
+    if not HAS_PIL:
+        return
+
+    # Icons are laid out left to right in a single row
+    atlas = Image.new('RGBA', (size * len(buttons), size), (0, 0, 0, 0))
+    manifest = {}
+    for index, (name, symbol, color) in enumerate(buttons):
+        x = index * size
+        atlas.paste(create_button_icon(symbol, color, size), (x, 0))
+        manifest[name] = [x, 0, size, size]
+
+    atlas.save(output_path, 'PNG')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
     print(f"Created: {output_path}")
+    print(f"Created: {manifest_path}")
 
 
 def main():
     """Generate all default assets."""
     # Create directories
     assets_dir = Path("assets")
-    button_icons_dir = assets_dir / "button_icons"
-
     assets_dir.mkdir(exist_ok=True)
-    button_icons_dir.mkdir(exist_ok=True)
 
     # Create game icons directory
     game_icons_dir = assets_dir / "game_icons"
@@ -171,18 +197,15 @@ def main():
     # Create default game icon
     create_default_icon(str(assets_dir / "default_icon.png"), 256)
 
-    # Create PlayStation button icons
-    # X button (blue for PlayStation style)
-    create_button_icon(str(button_icons_dir / "cross.png"), 'X', (100, 149, 237), 64)
-
-    # Circle button (red)
-    create_button_icon(str(button_icons_dir / "circle.png"), 'O', (255, 100, 100), 64)
-
-    # Triangle button (green/teal)
-    create_button_icon(str(button_icons_dir / "triangle.png"), '△', (100, 200, 170), 64)
-
-    # Square button (pink/magenta)
-    create_button_icon(str(button_icons_dir / "square.png"), '□', (255, 150, 200), 64)
+    # Create PlayStation button icons, packed into one atlas
+    buttons = [
+        ('cross', 'X', (100, 149, 237)),      # blue for PlayStation style
+        ('circle', 'O', (255, 100, 100)),     # red
+        ('triangle', '△', (100, 200, 170)),  # green/teal
+        ('square', '□', (255, 150, 200)),     # pink/magenta
+    ]
+    create_button_atlas(str(assets_dir / "button_atlas.png"),
+                        str(assets_dir / "button_atlas.json"), buttons, 64)
 
     print("\nAsset generation complete!")
 
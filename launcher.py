@@ -5,19 +5,52 @@ Coordinates the game manager, controller input, and UI rendering.
 
 import os
 import sys
-import json
+import copy
+import logging
+import queue
+import threading
 import time
 import pygame
-import ctypes
 from typing import Optional, Dict, Any
 from enum import Enum, auto
+from types import MappingProxyType
 from pathlib import Path
 
+from config_cache import load_config, save_config
 from controller import InputHandler, InputAction
 from game_manager import GameManager, Game
 from ui import UIRenderer
 
 
+# Settings used where config.json doesn't override them. Built once and
+# read-only; _load_config() merges the user's file into a deep copy
+DEFAULT_CONFIG = MappingProxyType({
+    "game_folders": [],
+    "window": {
+        "width": 1920,
+        "height": 1080,
+        "fullscreen": False
+    },
+    "ui": {
+        "tiles_per_row": 7,
+        "tile_size": 200,
+        "tile_spacing": 30,
+        "scroll_speed": 15,
+        "highlight_color": [0, 150, 255],
+        "background_color": [20, 20, 30],
+        "text_color": [255, 255, 255]
+    },
+    "controller": {
+        "deadzone": 0.3,
+        "repeat_delay": 500,
+        "repeat_interval": 150
+    },
+    "sorting": "alphabetical",
+    "show_recently_played": True,
+    "max_recent_games": 10
+})
+
+
 class LauncherState(Enum):
     """Enumeration of launcher states."""
     LOADING = auto()
@@ -37,10 +70,28 @@ class GameLauncher:
     CONFIG_FILE = "config.json"
     CACHE_FILE = "games_cache.json"
 
+    # Controller hotplug events, forwarded to the input handler
+    DEVICE_EVENT_TYPES = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
+    # Window events after which the window contents must be redrawn
+    EXPOSE_EVENT_TYPES = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+    # States whose screen has no animation, so an unchanged frame is skipped
+    STATIC_STATES = frozenset({LauncherState.ERROR})
+
+    # Sort orders cycled through from the settings menu
+    SORT_OPTIONS = ('alphabetical', 'recent', 'folder', 'play_count')
+
+    # Windows DPI_AWARENESS_CONTEXT handle value
+    DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+    _dpi_aware_set = False  # process-wide, see _ensure_dpi_aware()
+
     def __init__(self):
         """Initialize the game launcher."""
-        # Load configuration
+        # Load configuration. Defaults are merged in, so every section and
+        # key exists; keep the sections used after startup at hand
         self.config = self._load_config()
+        self._window_config = self.config['window']
 
         # Set SDL environment variables for better controller support
         # These must be set BEFORE pygame.init()
@@ -54,7 +105,7 @@ class GameLauncher:
         self._setup_display()
 
         # Initialize components
-        self.input_handler = InputHandler(self.config.get('controller', {}))
+        self.input_handler = InputHandler(self.config['controller'])
         self.game_manager = GameManager(self.config, self.CACHE_FILE)
         self.ui = UIRenderer(self.screen, self.config)
 
@@ -66,8 +117,23 @@ class GameLauncher:
         # Selection state
         self.selected_index = 0
         self.settings_selected = 0
+        # Settings menu actions, in the order UIRenderer lists the options
+        self._settings_handlers = (
+            self._settings_folders,
+            self._settings_fullscreen,
+            self._settings_sort,
+            self._settings_rescan,
+            self._settings_back,
+        )
         self.games = []
 
+        # Background game scan, and the progress it reports
+        self._scan_thread: Optional[threading.Thread] = None
+        self._scan_progress: queue.Queue = queue.Queue()
+        self._scan_cancel = threading.Event()
+        self._loading_message = "Loading Games..."
+        self._loading_progress = -1
+
         # Error state
         self.error_title = ""
         self.error_message = ""
@@ -75,6 +141,16 @@ class GameLauncher:
         # Timing
         self.clock = pygame.time.Clock()
         self.fps = 60
+        # While idle only the ambient particles move, redrawn at this rate
+        self.idle_fps = 20
+        self.idle_frame_ms = 1000 // self.idle_fps
+
+        self._frame_time = 0  # time.monotonic_ns() at the start of the frame
+
+        # Set when something on screen changed and the next frames should
+        # be drawn at full rate
+        self._dirty = True
+        self._last_render_key = None  # content of the last static frame drawn
 
     def _setup_sdl_controller_support(self):
         """
@@ -102,66 +178,41 @@ class GameLauncher:
         Returns:
             Configuration dictionary
         """
-        default_config = {
-            "game_folders": [],
-            "window": {
-                "width": 1920,
-                "height": 1080,
-                "fullscreen": False
-            },
-            "ui": {
-                "tiles_per_row": 7,
-                "tile_size": 200,
-                "tile_spacing": 30,
-                "scroll_speed": 15,
-                "highlight_color": [0, 150, 255],
-                "background_color": [20, 20, 30],
-                "text_color": [255, 255, 255]
-            },
-            "controller": {
-                "deadzone": 0.3,
-                "repeat_delay": 500,
-                "repeat_interval": 150
-            },
-            "sorting": "alphabetical",
-            "show_recently_played": True,
-            "max_recent_games": 10
-        }
+        config = copy.deepcopy(dict(DEFAULT_CONFIG))
 
-        try:
-            if os.path.exists(self.CONFIG_FILE):
-                with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults
-                    self._deep_merge(default_config, loaded_config)
-                    return default_config
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading config: {e}")
-
-        return default_config
+        # Merge with defaults (main.py may already have parsed the file)
+        self._deep_merge(config, load_config(self.CONFIG_FILE))
+        return config
 
     def _deep_merge(self, base: dict, overlay: dict):
-        """Recursively merge overlay into base dictionary."""
-        for key, value in overlay.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        """Merge overlay into base, nested dicts included."""
+        # Walk nested dicts with an explicit stack instead of recursing
+        stack = [(base, overlay)]
+        while stack:
+            base, overlay = stack.pop()
+            for key, value in overlay.items():
+                base_value = base.get(key)
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    stack.append((base_value, value))
+                else:
+                    base[key] = value
 
     def _save_config(self):
         """Save current configuration to file."""
         try:
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            save_config(self.config, self.CONFIG_FILE)
         except IOError as e:
             print(f"Error saving config: {e}")
 
     def _setup_display(self):
         """Set up the Pygame display."""
-        window_config = self.config.get('window', {})
-        width = window_config.get('width', 1920)
-        height = window_config.get('height', 1080)
-        fullscreen = window_config.get('fullscreen', False)
+        window_config = self._window_config
+        width = window_config['width']
+        height = window_config['height']
+        fullscreen = window_config['fullscreen']
+
+        # Before the window is created, so it gets real pixel sizes
+        self._ensure_dpi_aware()
 
         flags = pygame.DOUBLEBUF | pygame.HWSURFACE
 
@@ -181,9 +232,26 @@ class GameLauncher:
         # Hide mouse cursor for controller-focused UI
         pygame.mouse.set_visible(False)
 
-        # Try to set DPI awareness on Windows
+
+    @classmethod
+    def _ensure_dpi_aware(cls):
+        """Mark the process DPI aware on Windows. Only needed once per process."""
+        if cls._dpi_aware_set or sys.platform != 'win32':
+            return
+        cls._dpi_aware_set = True
+
         try:
-            ctypes.windll.user32.SetProcessDPIAware()
+            import ctypes
+            user32 = ctypes.windll.user32
+            # Per-monitor awareness (Windows 10+) scales correctly when the
+            # window moves between monitors; fall back to system awareness
+            try:
+                context = ctypes.c_void_p(cls.DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2)
+                if user32.SetProcessDpiAwarenessContext(context):
+                    return
+            except AttributeError:
+                pass
+            user32.SetProcessDPIAware()
         except (AttributeError, OSError):
             pass
 
@@ -193,6 +261,13 @@ class GameLauncher:
         self._load_games()
 
         while self.running:
+            if self._is_idle():
+                # Nothing is moving: sleep until input arrives or the next
+                # ambient frame is due, instead of redrawing at full rate
+                event = pygame.event.wait(self.idle_frame_ms)
+                if event.type != pygame.NOEVENT:
+                    self._handle_event(event)
+
             # Handle events
             self._handle_events()
 
@@ -201,44 +276,108 @@ class GameLauncher:
 
             # Render
             self._render()
+            self._dirty = False
 
             # Cap framerate
             self.clock.tick(self.fps)
 
         self._cleanup()
 
+    def _is_idle(self) -> bool:
+        """
+        Check whether the next frame can wait for input.
+
+        Returns:
+            True if nothing changed and no animation or held input needs
+            full-rate frames
+        """
+        return not (self._dirty
+                    or self.state in (LauncherState.LOADING, LauncherState.LAUNCHING)
+                    or self.input_handler.is_input_held()
+                    or self.ui.is_animating())
+
     def _handle_events(self):
         """Handle Pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-
-            elif event.type == pygame.KEYDOWN:
-                # Handle one-shot key events
-                if event.key == pygame.K_F11:
-                    self._toggle_fullscreen()
-
-            elif event.type == pygame.JOYDEVICEADDED:
-                # Only show message if we weren't already connected
-                was_connected = self.input_handler.get_controller_state().connected
-                self.input_handler.check_controller_connection()
-                if not was_connected:
-                    self.ui.show_message("Controller connected")
-
-            elif event.type == pygame.JOYDEVICEREMOVED:
-                # Only show message if we were connected
-                was_connected = self.input_handler.get_controller_state().connected
-                self.input_handler.check_controller_connection()
-                if was_connected:
-                    self.ui.show_message("Controller disconnected")
+        # One clock reading per frame, shared by the input repeat timing
+        self._frame_time = time.monotonic_ns()
+
+        # Pump once, then drain only the event types the launcher uses
+        pygame.event.pump()
+
+        if pygame.event.get(pygame.QUIT, pump=False):
+            self.running = False
+
+        input_events = pygame.event.get(InputHandler.INPUT_EVENT_TYPES, pump=False)
+        if input_events:
+            # Keep the input handler's held-key/button state in sync
+            self.input_handler.handle_events(input_events)
+            for event in input_events:
+                self._handle_hotkey(event)
+
+        for event in pygame.event.get(self.DEVICE_EVENT_TYPES, pump=False):
+            self._handle_device_event(event)
+
+        if pygame.event.get(self.EXPOSE_EVENT_TYPES, pump=False):
+            self._dirty = True
+
+        # Drop everything else (mouse, window events) so the queue can't fill
+        pygame.event.clear(pump=False)
+
+    def _handle_event(self, event: pygame.event.Event):
+        """
+        Handle a single event taken off the queue outside _handle_events().
+
+        Args:
+            event: A pygame event
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type in self.DEVICE_EVENT_TYPES:
+            self._handle_device_event(event)
+        elif event.type in self.EXPOSE_EVENT_TYPES:
+            self._dirty = True
+        else:
+            self._handle_input_event(event)
+
+    def _handle_input_event(self, event: pygame.event.Event):
+        """Forward an input event to the input handler."""
+        # Keep the input handler's held-key/button state in sync
+        self.input_handler.handle_event(event)
+        self._handle_hotkey(event)
+
+    def _handle_hotkey(self, event: pygame.event.Event):
+        """Handle one-shot key events."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            self._toggle_fullscreen()
+
+    def _handle_device_event(self, event: pygame.event.Event):
+        """Handle a controller being plugged in or removed."""
+        # Only show a message when the connection actually changes
+        if self.input_handler.handle_device_event(event):
+            self._dirty = True
+            if self.input_handler.get_controller_state().connected:
+                self.ui.show_message("Controller connected")
+            else:
+                self.ui.show_message("Controller disconnected")
 
     def _update(self):
         """Update application state."""
         # Get input (controller connection is checked via pygame events)
-        action = self.input_handler.get_input()
+        action = self.input_handler.get_input(self._frame_time)
+        if action != InputAction.NONE:
+            # Any action can change selection, state or messages
+            self._dirty = True
+
+        if self._scan_thread is not None:
+            self._poll_scan()
 
         # Handle input based on current state
-        if self.state == LauncherState.MAIN_MENU:
+        if self.state == LauncherState.LOADING:
+            if action == InputAction.BACK and self._scan_thread is not None:
+                # Stop the scan after the current folder
+                self._scan_cancel.set()
+                self._loading_message = "Cancelling scan..."
+        elif self.state == LauncherState.MAIN_MENU:
             self._handle_main_menu_input(action)
         elif self.state == LauncherState.SETTINGS:
             self._handle_settings_input(action)
@@ -274,13 +413,11 @@ class GameLauncher:
 
     def _handle_settings_input(self, action: InputAction):
         """Handle input in the settings menu."""
-        settings_options = 5  # Number of settings options
-
         if action == InputAction.UP:
-            self.settings_selected = (self.settings_selected - 1) % settings_options
+            self.settings_selected = (self.settings_selected - 1) % len(self._settings_handlers)
 
         elif action == InputAction.DOWN:
-            self.settings_selected = (self.settings_selected + 1) % settings_options
+            self.settings_selected = (self.settings_selected + 1) % len(self._settings_handlers)
 
         elif action == InputAction.CONFIRM:
             self._handle_settings_selection()
@@ -290,36 +427,37 @@ class GameLauncher:
 
     def _handle_settings_selection(self):
         """Handle selection of a settings option."""
-        if self.settings_selected == 0:
-            # Game Folders - would open folder selection dialog
-            self.ui.show_message("Edit config.json to change game folders")
+        self._settings_handlers[self.settings_selected]()
 
-        elif self.settings_selected == 1:
-            # Toggle fullscreen
-            self._toggle_fullscreen()
+    def _settings_folders(self):
+        """Game Folders - would open folder selection dialog."""
+        self.ui.show_message("Edit config.json to change game folders")
 
-        elif self.settings_selected == 2:
-            # Cycle sort order
-            sort_options = ['alphabetical', 'recent', 'folder', 'play_count']
-            current = self.config.get('sorting', 'alphabetical')
-            try:
-                current_idx = sort_options.index(current)
-                next_idx = (current_idx + 1) % len(sort_options)
-            except ValueError:
-                next_idx = 0
-            self.config['sorting'] = sort_options[next_idx]
-            self._save_config()
-            self.games = self.game_manager.get_games(self.config['sorting'])
-            self.ui.show_message(f"Sort: {self.config['sorting'].title()}")
-
-        elif self.settings_selected == 3:
-            # Rescan games
-            self.state = LauncherState.MAIN_MENU
-            self._rescan_games()
+    def _settings_fullscreen(self):
+        """Toggle fullscreen."""
+        self._toggle_fullscreen()
 
-        elif self.settings_selected == 4:
-            # Back to main menu
-            self.state = LauncherState.MAIN_MENU
+    def _settings_sort(self):
+        """Cycle sort order."""
+        current = self.config['sorting']
+        try:
+            current_idx = self.SORT_OPTIONS.index(current)
+            next_idx = (current_idx + 1) % len(self.SORT_OPTIONS)
+        except ValueError:
+            next_idx = 0
+        self.config['sorting'] = self.SORT_OPTIONS[next_idx]
+        self._save_config()
+        self.games = self.game_manager.get_games(self.config['sorting'])
+        self.ui.show_message(f"Sort: {self.config['sorting'].title()}")
+
+    def _settings_rescan(self):
+        """Rescan games."""
+        self.state = LauncherState.MAIN_MENU
+        self._rescan_games()
+
+    def _settings_back(self):
+        """Back to main menu."""
+        self.state = LauncherState.MAIN_MENU
 
     def _handle_error_input(self, action: InputAction):
         """Handle input in the error state."""
@@ -335,16 +473,29 @@ class GameLauncher:
 
     def _render(self):
         """Render the current state."""
+        controller_connected = self.input_handler.get_controller_state().connected
+
+        if self.state in self.STATIC_STATES:
+            # Nothing animates on these screens; redraw only when the
+            # content changed
+            render_key = (self.state, self.error_title, self.error_message,
+                          controller_connected)
+            if render_key == self._last_render_key and not self._dirty:
+                return
+            self._last_render_key = render_key
+        else:
+            self._last_render_key = None
+
         button_prompts = self.input_handler.get_button_prompts()
 
         if self.state == LauncherState.LOADING:
-            self.ui.render_loading_screen("Loading Games...", -1)
+            self.ui.render_loading_screen(self._loading_message, self._loading_progress)
 
         elif self.state == LauncherState.MAIN_MENU:
             self.ui.render_main_screen(
                 self.games,
                 self.selected_index,
-                self.input_handler.get_controller_state().connected,
+                controller_connected,
                 button_prompts
             )
 
@@ -353,7 +504,7 @@ class GameLauncher:
             self.ui.render_main_screen(
                 self.games,
                 self.selected_index,
-                self.input_handler.get_controller_state().connected,
+                controller_connected,
                 button_prompts
             )
             # Then render settings overlay
@@ -374,7 +525,7 @@ class GameLauncher:
             self.ui.render_main_screen(
                 self.games,
                 self.selected_index,
-                self.input_handler.get_controller_state().connected,
+                controller_connected,
                 button_prompts
             )
             # Then render confirmation dialog
@@ -390,7 +541,6 @@ class GameLauncher:
         """Load games from cache or scan."""
         self.state = LauncherState.LOADING
         self._render()
-        pygame.display.flip()
 
         # Try to load from cache first
         if self.game_manager.load_cache():
@@ -403,29 +553,84 @@ class GameLauncher:
         self._rescan_games()
 
     def _rescan_games(self):
-        """Rescan for games in configured folders."""
-        self.state = LauncherState.LOADING
+        """
+        Rescan for games in configured folders.
+        The scan runs on a worker thread; _poll_scan() picks up its progress
+        and result from the main loop.
+        """
+        if self._scan_thread is not None:
+            # Already scanning
+            return
 
-        folders = self.config.get('game_folders', [])
+        folders = self.config['game_folders']
 
         if not folders:
             self.ui.show_message("No game folders configured")
             self.state = LauncherState.MAIN_MENU
             return
 
-        def progress_callback(message: str, progress: float):
-            self.ui.render_loading_screen(message, progress)
-            pygame.display.flip()
-            pygame.event.pump()  # Keep window responsive
+        self.state = LauncherState.LOADING
+        self._loading_message = "Scanning for games..."
+        self._loading_progress = -1
+        self._scan_cancel.clear()
+        self._scan_thread = threading.Thread(
+            target=self._run_scan,
+            args=(folders,),
+            name="GameScan",
+            daemon=True
+        )
+        self._scan_thread.start()
+
+    def _run_scan(self, folders):
+        """
+        Body of the scan thread.
+        Shortcuts are resolved through COM, which has to be initialized on
+        every thread that uses it.
+
+        Args:
+            folders: Game folders to scan
+        """
+        try:
+            import pythoncom
+        except ImportError:
+            pythoncom = None
+
+        if pythoncom is not None:
+            pythoncom.CoInitialize()
+        try:
+            self.game_manager.scan_games(folders, self._on_scan_progress, self._scan_cancel)
+        finally:
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def _on_scan_progress(self, message: str, progress: float):
+        """Progress callback for the scan thread; handed over via a queue."""
+        self._scan_progress.put((message, progress))
+
+    def _poll_scan(self):
+        """Show the running scan's progress and finish up once it is done."""
+        try:
+            while True:
+                self._loading_message, self._loading_progress = self._scan_progress.get_nowait()
+        except queue.Empty:
+            pass
+
+        if self._scan_thread.is_alive():
+            return
 
-        self.games = self.game_manager.scan_games(folders, progress_callback)
+        self._scan_thread = None
+        cancelled = self._scan_cancel.is_set()
+        self.games = self.game_manager.get_games()
         self.selected_index = min(self.selected_index, max(0, len(self.games) - 1))
 
         # Clear icon cache to reload any changed icons
         self.ui.clear_icon_cache()
 
         self.state = LauncherState.MAIN_MENU
-        self.ui.show_message(f"Found {len(self.games)} games")
+        if cancelled:
+            self.ui.show_message("Scan cancelled")
+        else:
+            self.ui.show_message(f"Found {len(self.games)} games")
 
     def _launch_selected_game(self):
         """Launch the currently selected game."""
@@ -470,17 +675,18 @@ class GameLauncher:
 
     def _toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
-        current_fullscreen = self.config.get('window', {}).get('fullscreen', False)
-        self.config['window']['fullscreen'] = not current_fullscreen
+        window_config = self._window_config
+        window_config['fullscreen'] = not window_config['fullscreen']
         self._save_config()
 
         # Re-setup display
         self._setup_display()
 
-        # Recreate UI with new screen
-        self.ui = UIRenderer(self.screen, self.config)
+        # Point the UI at the new screen, keeping its loaded fonts and icons
+        self.ui.set_screen(self.screen)
+        self._dirty = True
 
-        mode = "Fullscreen" if self.config['window']['fullscreen'] else "Windowed"
+        mode = "Fullscreen" if window_config['fullscreen'] else "Windowed"
         self.ui.show_message(f"Mode: {mode}")
 
     def _show_error(self, title: str, message: str):
@@ -498,7 +704,11 @@ class GameLauncher:
 
     def _cleanup(self):
         """Clean up resources before exit."""
+        # Let a running scan stop at its next folder
+        self._scan_cancel.set()
         self.input_handler.cleanup()
+        # Icon loads still running use SDL, so finish them before quitting
+        self.ui.shutdown()
         pygame.quit()
 
 
@@ -507,6 +717,8 @@ def main():
     # Change to script directory
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     launcher = GameLauncher()
     launcher.run()
 
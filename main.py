@@ -11,35 +11,35 @@ Options:
     --fullscreen    Start in fullscreen mode
     --windowed      Start in windowed mode
     --scan          Force rescan of game folders
+    --verbose       Show detailed diagnostic logging
     --help          Show this help message
 """
 
 import sys
 import os
-import argparse
+import logging
+from importlib.util import find_spec
+from types import SimpleNamespace
 
 
-def check_dependencies():
-    """Check if required dependencies are installed."""
-    missing = []
+# Required modules as (import name, package to install)
+REQUIRED_MODULES = (
+    ("pygame", "pygame"),
+    ("PIL", "Pillow"),
+)
 
-    try:
-        import pygame
-    except ImportError:
-        missing.append("pygame")
 
-    try:
-        from PIL import Image
-    except ImportError:
-        missing.append("Pillow")
+def check_dependencies():
+    """Check if required dependencies are installed."""
+    # Look the modules up without importing them; importing pygame alone
+    # loads SDL, which --list-games and --add-folder never need
+    missing = [package for module, package in REQUIRED_MODULES
+               if find_spec(module) is None]
 
     # win32 is optional but recommended on Windows
-    if sys.platform == 'win32':
-        try:
-            import win32api
-        except ImportError:
-            print("Warning: pywin32 not installed. Icon extraction will be limited.")
-            print("Install with: pip install pywin32")
+    if sys.platform == 'win32' and find_spec("win32api") is None:
+        print("Warning: pywin32 not installed. Icon extraction will be limited.")
+        print("Install with: pip install pywin32")
 
     if missing:
         print("Error: Missing required dependencies:")
@@ -50,8 +50,31 @@ def check_dependencies():
         sys.exit(1)
 
 
+# Loggers of the launcher's own modules, raised to DEBUG by --verbose
+PROJECT_LOGGERS = ('controller',)
+
+
+# Option values when not given on the command line
+DEFAULT_ARGUMENTS = {
+    'fullscreen': False,
+    'windowed': False,
+    'scan': False,
+    'resolution': None,
+    'add_folder': None,
+    'list_games': False,
+    'verbose': False,
+}
+
+
 def parse_arguments():
     """Parse command line arguments."""
+    # A plain launch and --list-games on its own don't need argparse
+    argv = sys.argv[1:]
+    if not argv or argv == ['--list-games']:
+        return SimpleNamespace(**dict(DEFAULT_ARGUMENTS, list_games=bool(argv)))
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Game Launcher - A PlayStation-style game launcher for PC",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -107,23 +130,24 @@ Configuration:
         help='List all detected games and exit'
     )
 
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show detailed diagnostic logging (controller detection, button mapping)'
+    )
+
+    # Keep parsed defaults identical to the fast path's
+    parser.set_defaults(**DEFAULT_ARGUMENTS)
+
     return parser.parse_args()
 
 
 def apply_arguments(args):
     """Apply command line arguments to configuration."""
-    import json
+    from config_cache import load_config, save_config
 
-    config_file = "config.json"
-    config = {}
-
-    # Load existing config
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+    # Load existing config (shared with the launcher, which reads it next)
+    config = load_config()
 
     modified = False
 
@@ -172,8 +196,7 @@ def apply_arguments(args):
     # Save modified config
     if modified:
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            save_config(config)
         except IOError as e:
             print(f"Error saving config: {e}")
 
@@ -183,17 +206,9 @@ def apply_arguments(args):
 def list_games():
     """List all detected games and exit."""
     from game_manager import GameManager
-    import json
+    from config_cache import load_config
 
-    config_file = "config.json"
-    config = {}
-
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+    config = load_config()
 
     gm = GameManager(config)
 
@@ -237,7 +252,14 @@ def main():
     # Parse arguments first (before checking deps for --help)
     args = parse_arguments()
 
-    # Handle list-games before importing pygame
+    # Send module logging to the console; --verbose adds the launcher's own
+    # diagnostics, without turning on debug output from libraries like PIL
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.verbose:
+        for name in PROJECT_LOGGERS:
+            logging.getLogger(name).setLevel(logging.DEBUG)
+
+    # Handle list-games without ever importing pygame
     if args.list_games:
         check_dependencies()
         list_games()
@@ -4,9 +4,90 @@ Tests controller detection and button mapping for Bluetooth troubleshooting.
 """
 
 import os
+import re
 import sys
-import pygame
 import time
+import pygame
+
+# Events the button test reacts to; anything else is discarded
+HANDLED_EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.JOYHATMOTION, pygame.JOYAXISMOTION,
+)
+
+# Expected PlayStation button layout, by button number
+BUTTON_NAMES = {
+    0: "Cross/X (Confirm)",
+    1: "Circle/O (Back)",
+    2: "Square",
+    3: "Triangle (Rescan)",
+    9: "Options",
+}
+
+# Name fragments that identify a PlayStation controller, in one pattern so
+# each name is scanned once ("ps4 controller" etc. are covered by "ps4")
+_PS_NAME_RE = re.compile(
+    'playstation|ps4|ps5|dualshock|dualsense|wireless controller|'
+    'sony interactive entertainment|sony computer entertainment'
+)
+
+# D-pad hat value -> direction label
+HAT_NAMES = {
+    (0, 0): "CENTER",
+    (0, 1): "UP", (0, -1): "DOWN",
+    (-1, 0): "LEFT", (1, 0): "RIGHT",
+    (-1, 1): "LEFT + UP", (1, 1): "RIGHT + UP",
+    (-1, -1): "LEFT + DOWN", (1, -1): "RIGHT + DOWN",
+}
+
+# Axis labels where the layout is known; other axes are reported by number
+AXIS_NAMES = {
+    0: "Left Stick X",
+    1: "Left Stick Y",
+}
+
+# An axis is reported once it's pushed past AXIS_DEADZONE, then again each
+# time it moves by more than AXIS_REPORT_STEP
+AXIS_DEADZONE = 0.5
+AXIS_REPORT_STEP = 0.3
+
+# Banner text, printed in one go
+NO_CONTROLLERS_HELP = """\
+❌ No controllers detected!
+
+Troubleshooting steps:
+1. For USB: Check cable connection (some cables are charge-only)
+2. For Bluetooth:
+   - PS4: Hold PS + Share buttons until light flashes
+   - PS5: Hold PS + Create buttons until light flashes
+   - Pair in Windows Bluetooth settings"""
+
+BUTTON_MAPPING_HELP = f"""
+Expected PlayStation button mappings:
+  Button 0: Cross (X) - Confirm
+  Button 1: Circle (O) - Back
+  Button 2: Square
+  Button 3: Triangle - Rescan
+  Button 9: Options
+
+Press buttons on your controller (Ctrl+C to exit)...
+{'-' * 70}"""
+
+# Report formatters for expected and unmapped buttons
+_format_expected_button = "✓ Button {} PRESSED - Expected: {}".format
+_format_other_button = "  Button {} pressed".format
+
+def write_lines(lines):
+    """
+    Write lines to stdout with a single write and flush.
+
+    Args:
+        lines: Lines of text, without trailing newlines
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 def setup_sdl():
     """Set up SDL environment variables for controller support."""
@@ -16,27 +97,26 @@ def setup_sdl():
     os.environ['SDL_JOYSTICK_HIDAPI_PS5_RUMBLE'] = '1'
     os.environ['SDL_JOYSTICK_ALLOW_BACKGROUND_EVENTS'] = '1'
     os.environ['SDL_JOYSTICK_THREAD'] = '1'
+    os.environ['SDL_JOYSTICK_HIDAPI'] = '1'
+    if sys.platform == 'win32':
+        # Leave PlayStation pads to HIDAPI: the RawInput driver only sees
+        # new input when the main thread pumps window messages
+        os.environ['SDL_JOYSTICK_RAWINPUT'] = '0'
     print("✓ SDL environment variables configured")
 
 def detect_controllers():
     """Detect and display information about all connected controllers."""
-    pygame.init()
+    # Only the subsystems the test uses: the event queue needs video, but
+    # audio, fonts etc. would only slow startup down
+    pygame.display.init()
     pygame.joystick.init()
 
     count = pygame.joystick.get_count()
-    print(f"\n{'='*70}")
-    print(f"CONTROLLER DETECTION TEST")
-    print(f"{'='*70}")
-    print(f"\nDetected {count} controller(s)\n")
+    print(f"\n{'='*70}\nCONTROLLER DETECTION TEST\n{'='*70}\n"
+          f"\nDetected {count} controller(s)\n")
 
     if count == 0:
-        print("❌ No controllers detected!")
-        print("\nTroubleshooting steps:")
-        print("1. For USB: Check cable connection (some cables are charge-only)")
-        print("2. For Bluetooth:")
-        print("   - PS4: Hold PS + Share buttons until light flashes")
-        print("   - PS5: Hold PS + Create buttons until light flashes")
-        print("   - Pair in Windows Bluetooth settings")
+        print(NO_CONTROLLERS_HELP)
         return None
 
     controllers = []
@@ -45,24 +125,18 @@ def detect_controllers():
             joystick = pygame.joystick.Joystick(i)
             joystick.init()
 
-            print(f"Controller {i}:")
-            print(f"  Name: {joystick.get_name()}")
-            print(f"  GUID: {joystick.get_guid()}")
-            print(f"  Buttons: {joystick.get_numbuttons()}")
-            print(f"  Axes: {joystick.get_numaxes()}")
-            print(f"  Hats (D-pads): {joystick.get_numhats()}")
+            name = joystick.get_name()
 
             # Check if it's a PlayStation controller
-            name_lower = joystick.get_name().lower()
-            ps_identifiers = [
-                'playstation', 'ps4', 'ps5', 'dualshock', 'dualsense',
-                'wireless controller', 'ps4 controller', 'ps5 controller',
-                'sony interactive entertainment', 'sony computer entertainment'
-            ]
+            is_playstation = _PS_NAME_RE.search(name.lower()) is not None
 
-            is_playstation = any(ps_id in name_lower for ps_id in ps_identifiers)
-            print(f"  Detected as: {'✓ PlayStation Controller' if is_playstation else '⚠ Generic Controller'}")
-            print()
+            print(f"Controller {i}:\n"
+                  f"  Name: {name}\n"
+                  f"  GUID: {joystick.get_guid()}\n"
+                  f"  Buttons: {joystick.get_numbuttons()}\n"
+                  f"  Axes: {joystick.get_numaxes()}\n"
+                  f"  Hats (D-pads): {joystick.get_numhats()}\n"
+                  f"  Detected as: {'✓ PlayStation Controller' if is_playstation else '⚠ Generic Controller'}\n")
 
             controllers.append(joystick)
         except pygame.error as e:
@@ -76,93 +150,76 @@ def test_buttons(controllers):
         return
 
     joystick = controllers[0]
-    print(f"{'='*70}")
-    print(f"BUTTON MAPPING TEST - Using Controller: {joystick.get_name()}")
-    print(f"{'='*70}")
-    print("\nExpected PlayStation button mappings:")
-    print("  Button 0: Cross (X) - Confirm")
-    print("  Button 1: Circle (O) - Back")
-    print("  Button 2: Square")
-    print("  Button 3: Triangle - Rescan")
-    print("  Button 9: Options")
-    print("\nPress buttons on your controller (Ctrl+C to exit)...")
-    print("-" * 70)
-
-    clock = pygame.time.Clock()
-    last_button_state = {}
+    print(f"{'='*70}\nBUTTON MAPPING TEST - Using Controller: {joystick.get_name()}\n"
+          f"{'='*70}\n{BUTTON_MAPPING_HELP}")
+
+    instance_id = joystick.get_instance_id()
+    last_hat = (0, 0)
+    last_axes = [0.0] * joystick.get_numaxes()
+    # Report lines for the current batch, written out together so bursts of
+    # input don't turn into one console write per line
+    out = []
 
     try:
         while True:
-            pygame.event.pump()
-
-            # Check all buttons
-            for btn in range(joystick.get_numbuttons()):
-                pressed = joystick.get_button(btn)
-
-                # Only print on state change
-                if btn not in last_button_state or last_button_state[btn] != pressed:
-                    if pressed:
-                        button_name = ""
-                        if btn == 0:
-                            button_name = "Cross/X (Confirm)"
-                        elif btn == 1:
-                            button_name = "Circle/O (Back)"
-                        elif btn == 2:
-                            button_name = "Square"
-                        elif btn == 3:
-                            button_name = "Triangle (Rescan)"
-                        elif btn == 9:
-                            button_name = "Options"
-
-                        if button_name:
-                            print(f"✓ Button {btn} PRESSED - Expected: {button_name}")
-                        else:
-                            print(f"  Button {btn} pressed")
-
-                    last_button_state[btn] = pressed
-
-            # Check D-pad (hat)
-            if joystick.get_numhats() > 0:
-                hat = joystick.get_hat(0)
-                if hat != (0, 0):
-                    direction = []
-                    if hat[0] == -1:
-                        direction.append("LEFT")
-                    elif hat[0] == 1:
-                        direction.append("RIGHT")
-                    if hat[1] == 1:
-                        direction.append("UP")
-                    elif hat[1] == -1:
-                        direction.append("DOWN")
-
-                    if 'last_hat' not in locals() or locals()['last_hat'] != hat:
-                        print(f"✓ D-Pad: {' + '.join(direction)}")
-                        locals()['last_hat'] = hat
-                elif 'last_hat' in locals() and locals()['last_hat'] != (0, 0):
-                    locals()['last_hat'] = (0, 0)
-
-            # Check analog sticks
-            if joystick.get_numaxes() >= 2:
-                left_x = joystick.get_axis(0)
-                left_y = joystick.get_axis(1)
-
-                if abs(left_x) > 0.5 or abs(left_y) > 0.5:
-                    if 'last_stick' not in locals() or (
-                        abs(locals()['last_stick'][0] - left_x) > 0.3 or
-                        abs(locals()['last_stick'][1] - left_y) > 0.3
-                    ):
-                        print(f"✓ Left Stick: X={left_x:.2f}, Y={left_y:.2f}")
-                        locals()['last_stick'] = (left_x, left_y)
-
-            clock.tick(30)  # 30 FPS
+            # Sleep until input arrives instead of ticking at a fixed rate.
+            # The timeout lets Ctrl+C through while nothing is happening
+            first = pygame.event.wait(500)
+            events = [first] if first.type in HANDLED_EVENT_TYPES else []
+
+            # Drain everything already queued before reporting, so a burst
+            # of stick motion can't leave the output lagging behind
+            while batch := pygame.event.get(HANDLED_EVENT_TYPES):
+                events.extend(batch)
+            pygame.event.clear(pump=False)
+
+            # Button presses, D-pad and axis motion arrive as events, so
+            # there's no need to scan every button and axis
+            moved_axes = {}
+            for event in events:
+                if event.type == pygame.QUIT:
+                    # SDL turns Ctrl+C into a quit event on some platforms
+                    raise KeyboardInterrupt
+                if event.instance_id != instance_id:
+                    continue
+                if event.type == pygame.JOYAXISMOTION:
+                    # Only the latest position of each axis matters
+                    moved_axes[event.axis] = event.value
+                    continue
+                if event.type == pygame.JOYHATMOTION:
+                    # Every change is kept so quick taps aren't lost;
+                    # releasing the D-pad isn't reported
+                    hat = event.value
+                    if event.hat == 0 and hat != last_hat:
+                        if hat != (0, 0):
+                            out.append(f"✓ D-Pad: {HAT_NAMES.get(hat, hat)}")
+                        last_hat = hat
+                    continue
+                if event.type != pygame.JOYBUTTONDOWN:
+                    continue
+
+                btn = event.button
+                button_name = BUTTON_NAMES.get(btn)
+                out.append(_format_expected_button(btn, button_name) if button_name
+                           else _format_other_button(btn))
+
+            # Check analog sticks and triggers that moved
+            for axis, value in moved_axes.items():
+                if (abs(value) > AXIS_DEADZONE and
+                        abs(value - last_axes[axis]) > AXIS_REPORT_STEP):
+                    out.append(f"✓ {AXIS_NAMES.get(axis, f'Axis {axis}')}: {value:.2f}")
+                    last_axes[axis] = value
+
+            write_lines(out)
+            out.clear()
 
     except KeyboardInterrupt:
+        write_lines(out)
         print("\n\nTest completed!")
 
 def main():
     """Main test function."""
-    print("PS4/PS5 Controller Detection and Testing Tool")
-    print("=" * 70)
+    print(f"PS4/PS5 Controller Detection and Testing Tool\n{'=' * 70}")
 
     # Setup SDL
     setup_sdl()
@@ -171,9 +228,16 @@ def main():
     controllers = detect_controllers()
 
     if controllers:
-        print("\n✓ Controller detection successful!")
-        print("\nStarting button mapping test...")
-        time.sleep(1)
+        print("\n✓ Controller detection successful!\n\nStarting button mapping test...")
+        # Give the user a moment to read, but start as soon as they
+        # touch the controller. The device events SDL queues at startup
+        # don't count as touching it
+        deadline = time.monotonic() + 1.0
+        while (remaining := deadline - time.monotonic()) > 0:
+            event = pygame.event.wait(max(1, int(remaining * 1000)))
+            if event.type in HANDLED_EVENT_TYPES:
+                pygame.event.post(event)
+                break
         test_buttons(controllers)
     else:
         print("\n❌ No controllers detected. Please check connection and try again.")
@@ -8,6 +8,10 @@ import io
 import pygame
 import math
 import random
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
@@ -22,6 +26,7 @@ except ImportError:
     except ImportError:
         HAS_PIL = False
 
+from controller import ButtonPrompts
 from game_manager import Game
 
 
@@ -62,6 +67,163 @@ class Colors:
     GLOW_OUTER = (0, 150, 255)
 
 
+# (cos, sin) of each whole degree from -90 (the top of a circle) round to
+# 269, for the loading spinner and progress ring
+_UNIT_CIRCLE = [(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+                for angle in range(-90, 270)]
+
+
+def _vertical_gradient(colors: List[Tuple[int, ...]], width: int) -> pygame.Surface:
+    """
+    Build a surface filled with one color per row.
+    The colors are packed into a one pixel wide strip that SDL stretches
+    across, instead of drawing every row as a separate line.
+
+    Args:
+        colors: RGB or RGBA color of each row, top to bottom
+        width: Width of the surface
+
+    Returns:
+        Surface of size (width, len(colors)); per-pixel alpha if RGBA
+    """
+    mode = 'RGBA' if len(colors[0]) == 4 else 'RGB'
+    pixels = bytes(channel for color in colors for channel in color)
+    strip = pygame.image.frombuffer(pixels, (1, len(colors)), mode)
+    return pygame.transform.scale(strip, (width, len(colors)))
+
+
+def _load_image(path: str) -> pygame.Surface:
+    """
+    Load an image file into a surface.
+    AVIF and other formats SDL_image can't read go through PIL.
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        Loaded surface, in the file's own pixel format
+    """
+    if HAS_PIL and path.lower().endswith(('.avif', '.webp', '.heic', '.heif')):
+        pil_image = Image.open(path)
+        if pil_image.mode != 'RGBA':
+            pil_image = pil_image.convert('RGBA')
+        # The surface wraps the decoded bytes instead of copying them again
+        return pygame.image.frombuffer(pil_image.tobytes(), pil_image.size, 'RGBA')
+    return pygame.image.load(path)
+
+
+def _decode_icon(icon_path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """
+    Load an image and scale/crop it to fill a tile.
+    Runs on the icon loader threads, so it only touches its own surfaces.
+
+    Args:
+        icon_path: Path to the image file
+        size: (width, height) to fill
+
+    Returns:
+        Surface of exactly the given size, or None if the image can't be loaded
+    """
+    if not os.path.exists(icon_path):
+        return None
+
+    try:
+        icon = _load_image(icon_path)
+
+        # Scale to fill the tile while maintaining aspect ratio
+        icon_rect = icon.get_rect()
+        scale = max(size[0] / icon_rect.width, size[1] / icon_rect.height)
+        new_size = (max(1, int(icon_rect.width * scale)), max(1, int(icon_rect.height * scale)))
+        icon = pygame.transform.smoothscale(icon, new_size)
+
+        # Crop to exact size if needed
+        if icon.get_width() >= size[0] and icon.get_height() >= size[1]:
+            crop_rect = pygame.Rect(
+                (icon.get_width() - size[0]) // 2,
+                (icon.get_height() - size[1]) // 2,
+                size[0], size[1]
+            )
+            return icon.subsurface(crop_rect).copy()
+        # If image is smaller (off by a pixel of rounding), stretch it to the
+        # exact size; it's already been filtered, so plain scaling will do
+        return pygame.transform.scale(icon, size)
+    except (pygame.error, ValueError, Exception):
+        return None
+
+
+@lru_cache(maxsize=512)
+def _fit_text(font: pygame.font.Font, text: str, max_width: int) -> str:
+    """
+    Shorten text with an ellipsis so it fits within a width.
+    Cached, as the same names and labels are fitted every frame.
+
+    Args:
+        font: Font the text will be rendered with
+        text: Text to fit
+        max_width: Maximum width in pixels
+
+    Returns:
+        The text itself if it fits, otherwise its longest prefix that
+        fits with "..." appended
+    """
+    if font.size(text)[0] <= max_width or len(text) <= 3:
+        return text
+
+    # Binary search on the prefix length; the width grows with the prefix
+    lo, hi = 0, len(text) - 4
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.size(text[:mid] + "...")[0] <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "..."
+
+
+@lru_cache(maxsize=256)
+def _format_play_info(play_count: int, last_played: Optional[str]) -> str:
+    """
+    Format a game's play statistics for the info bar.
+    Cached, as the selected game's stats are shown every frame.
+
+    Args:
+        play_count: Number of times the game was launched
+        last_played: ISO timestamp of the last launch, if any
+
+    Returns:
+        Info text, or an empty string if the game was never played
+    """
+    info_parts = []
+    if play_count > 0:
+        info_parts.append(f"Played {play_count} time{'s' if play_count != 1 else ''}")
+    if last_played:
+        try:
+            dt = datetime.fromisoformat(last_played)
+            info_parts.append(f"Last played {dt.strftime('%B %d, %Y')}")
+        except ValueError:
+            pass
+    return "  |  ".join(info_parts)
+
+
+@lru_cache(maxsize=64)
+def _format_folders(folders: Tuple[str, ...]) -> str:
+    """
+    Format the configured game folders for the settings menu.
+    Cached, as the menu shows them every frame.
+
+    Args:
+        folders: Configured folder paths
+
+    Returns:
+        The folder's name if there's one, otherwise a count
+    """
+    if not folders:
+        return "Not configured"
+    if len(folders) == 1:
+        return Path(folders[0]).name
+    return f"{len(folders)} folders"
+
+
 class Particle:
     """Floating background particle for ambient effect."""
     def __init__(self, width: int, height: int):
@@ -73,18 +235,17 @@ class Particle:
         self.width = width
         self.height = height
 
-    def update(self):
-        self.y -= self.speed
+        # Size and alpha never change, so the dot is drawn once
+        self.sprite = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(self.sprite, (*Colors.PS_BLUE_LIGHT, self.alpha),
+                          (int(self.size), int(self.size)), int(self.size))
+
+    def update(self, steps: float = 1.0):
+        self.y -= self.speed * steps
         if self.y < -10:
             self.y = self.height + 10
             self.x = random.randint(0, self.width)
 
-    def draw(self, surface: pygame.Surface):
-        particle_surf = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surf, (*Colors.PS_BLUE_LIGHT, self.alpha),
-                          (int(self.size), int(self.size)), int(self.size))
-        surface.blit(particle_surf, (int(self.x), int(self.y)))
-
 
 class UIRenderer:
     """
@@ -92,11 +253,48 @@ class UIRenderer:
     Features gradient backgrounds, glowing selections, and smooth animations.
     """
 
+    # Ambient animations are tuned per 60 FPS frame and scaled by the real
+    # time between draws, so they keep their speed when redrawn less often
+    ANIMATION_FRAME_MS = 1000 / 60
+    MAX_ANIMATION_STEPS = 6  # cap the catch-up after a long blocking call
+
+    # Rendered text surfaces kept between frames (oldest dropped first)
+    TEXT_CACHE_SIZE = 64
+
+    # Threads decoding and scaling game art off the render loop
+    ICON_WORKERS = 2
+
+    # Corner radius of game tiles, baked into their cached art
+    TILE_CORNER_RADIUS = 12
+
+    # Unselected tiles shrink in steps of this scale as they move away from
+    # the center, so each poster is only cached at a few sizes
+    TILE_SCALE_STEP = 0.02
+
+    # Most recently used icons/backgrounds kept in memory
+    ICON_CACHE_SIZE = 256
+    BACKGROUND_CACHE_SIZE = 8
+
+    # Button prompt texts, filled in with the current controller's glyphs
+    SETTINGS_PROMPT = "{confirm} Select    {back} Back"
+    CONTINUE_PROMPT = "Press {confirm} to continue"
+    YES_PROMPT = "{confirm} Yes"
+    NO_PROMPT = "{back} No"
+
+    # Size of the pre-rendered error icon, and the point on it that's
+    # placed at the icon's position on screen
+    ERROR_ICON_SIZE = (100, 90)
+    ERROR_ICON_CENTER = (50, 45)
+
+    # Reusable per-frame overlay surfaces, one per size
+    SCRATCH_CACHE_SIZE = 8
+
     def __init__(self, screen: pygame.Surface, config: Dict[str, Any]):
         """Initialize the UI renderer."""
         self.screen = screen
         self.config = config
         self.width, self.height = screen.get_size()
+        self.center_x, self.center_y = self.width // 2, self.height // 2
 
         # UI settings from config
         ui_config = config.get('ui', {})
@@ -108,14 +306,58 @@ class UIRenderer:
         # Initialize fonts
         self._init_fonts()
 
-        # Load default icon
-        self.default_icon = self._create_default_icon()
+        # Default icon, drawn the first time a game without art needs it
+        self._default_icon: Optional[pygame.Surface] = None
+
+        # Icon/poster cache by (path, size), least recently used first
+        self.icon_cache: 'OrderedDict[Tuple[Optional[str], Tuple[int, int]], pygame.Surface]' = OrderedDict()
+        # Images are decoded on a small pool, one job per image path at a
+        # time: path -> (size, future). Until a size is ready, the last
+        # icon loaded for the path stands in for it
+        self._icon_pool = ThreadPoolExecutor(max_workers=self.ICON_WORKERS,
+                                             thread_name_prefix='icon-loader')
+        self._icon_jobs: Dict[str, Tuple[Tuple[int, int], Future]] = {}
+        self._latest_icons: Dict[str, pygame.Surface] = {}
+        # Stand-ins scaled from those, path -> {size: surface}, kept until
+        # the path's job is collected
+        self._icon_standins: Dict[str, Dict[Tuple[int, int], pygame.Surface]] = {}
+
+        # Rendered text by (font, text, color)
+        self.text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, ...]], pygame.Surface] = {}
+
+        # Selection glow sprites by (width, height, intensity)
+        self.glow_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+        # Settings menu highlight and text, laid out again only when the
+        # (values, selection, glyphs) key changes
+        self._settings_key: Optional[Tuple] = None
+        self._settings_blits: List[Tuple[pygame.Surface, Any]] = []
+
+        # Settings option highlight (glow, fill and border), built on first use
+        self._option_highlight: Optional[pygame.Surface] = None
 
-        # Icon/poster cache
-        self.icon_cache: Dict[str, pygame.Surface] = {}
+        # Confirmation dialog box and button backgrounds, built on first use
+        self._dialog_chrome: Optional[Tuple[pygame.Surface, pygame.Surface, pygame.Surface]] = None
 
-        # Background cache and state
-        self.background_cache: Dict[str, pygame.Surface] = {}
+        # Full-screen dimming overlays by alpha
+        self._dim_overlays: Dict[int, pygame.Surface] = {}
+
+        # Rendered button prompts by (template, prompts, font, color); the
+        # prompts only change with the input method
+        self._prompt_cache: Dict[Tuple[str, ButtonPrompts, pygame.font.Font, Tuple[int, ...]],
+                                 pygame.Surface] = {}
+
+        # Error screen icon, built on first use
+        self._error_icon: Optional[pygame.Surface] = None
+
+        # Loading spinner sprites by rotation (0-29 degrees)
+        self.spinner_cache: Dict[int, pygame.Surface] = {}
+
+        # Scratch surfaces for overlays drawn each frame, by (width, height)
+        self._scratch: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # Background cache (least recently used first) and state
+        self.background_cache: 'OrderedDict[str, pygame.Surface]' = OrderedDict()
         self.current_background: Optional[pygame.Surface] = None
         self.target_background: Optional[pygame.Surface] = None
         self.background_transition = 1.0  # 0 = showing current, 1 = showing target
@@ -126,6 +368,7 @@ class UIRenderer:
         self.target_scroll_offset = 0.0
         self.selection_animation = 0.0
         self.glow_animation = 0.0
+        self._last_animation_tick = 0
 
         # Background particles
         self.particles = [Particle(self.width, self.height) for _ in range(30)]
@@ -133,11 +376,144 @@ class UIRenderer:
         # Pre-render gradient background
         self.gradient_bg = self._create_gradient_background()
 
+        # Header/footer parts that don't change between frames, built on
+        # first use. The footer depends on the button prompts it shows
+        self._header_static: Optional[Tuple[pygame.Surface, pygame.Surface]] = None
+        self._footer_prompts: Optional[Tuple[str, ...]] = None
+        self._footer_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+        # Screen-wide gradient overlays, built on first use: the darkening
+        # baked into the bottom of backgrounds and the info bar's backdrop
+        self._background_shade: Optional[pygame.Surface] = None
+        self._info_bar_gradient: Optional[pygame.Surface] = None
+
         # Message overlay
         self.message: Optional[str] = None
         self.message_time = 0
         self.message_duration = 3000
 
+    def set_screen(self, screen: pygame.Surface):
+        """
+        Draw to a new display surface, e.g. after switching display modes.
+        Fonts and icons are kept; anything sized to the screen is rebuilt
+        only if the size changed.
+
+        Args:
+            screen: The new display surface
+        """
+        self.screen = screen
+        size = screen.get_size()
+        if size == (self.width, self.height):
+            return
+
+        self.width, self.height = size
+        self.center_x, self.center_y = self.width // 2, self.height // 2
+        self.gradient_bg = self._create_gradient_background()
+        self._header_static = None
+        self._footer_prompts = None
+        self._settings_key = None
+        self._scratch.clear()
+        self._dim_overlays.clear()
+        self._background_shade = None
+        self._info_bar_gradient = None
+        self.particles = [Particle(self.width, self.height) for _ in range(30)]
+
+        # Backgrounds are scaled to the screen; reload the current one
+        self.background_cache.clear()
+        self.current_background = None
+        self.target_background = self.load_background(self.current_bg_path)
+        self.background_transition = 1.0
+
+    def _render_text(self, font: pygame.font.Font, text: str,
+                     color: Tuple[int, ...]) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface from earlier frames.
+        The returned surface is shared, so callers must not modify it
+        (e.g. with set_alpha).
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= self.TEXT_CACHE_SIZE:
+                del self.text_cache[next(iter(self.text_cache))]
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+
+    def _render_prompt(self, template: str, button_prompts: ButtonPrompts,
+                       font: pygame.font.Font, color: Tuple[int, ...]) -> pygame.Surface:
+        """
+        Render a button prompt, formatting it only when the glyphs change.
+        The returned surface is shared, so callers must not modify it.
+
+        Args:
+            template: Prompt text with {confirm} and/or {back} placeholders
+            button_prompts: Button labels for the current input method
+            font: Font to render with
+            color: Text color
+
+        Returns:
+            Rendered prompt surface
+        """
+        key = (template, button_prompts, font, color)
+        surface = self._prompt_cache.get(key)
+        if surface is None:
+            text = template.format(confirm=button_prompts.confirm, back=button_prompts.back)
+            surface = font.render(text, True, color)
+            self._prompt_cache[key] = surface
+        return surface
+
+    def _get_scratch(self, width: int, height: int,
+                     color: Tuple[int, int, int, int] = (0, 0, 0, 0)) -> pygame.Surface:
+        """
+        Get a per-pixel alpha surface for drawing an overlay, reusing the
+        one from earlier frames rather than allocating it each time.
+        The surface is shared, so it's only valid until the next call.
+
+        Args:
+            width: Surface width
+            height: Surface height
+            color: Color the surface is filled with
+
+        Returns:
+            Scratch surface filled with color
+        """
+        key = (width, height)
+        surface = self._scratch.get(key)
+        if surface is None:
+            if len(self._scratch) >= self.SCRATCH_CACHE_SIZE:
+                self._scratch.clear()
+            surface = pygame.Surface(key, pygame.SRCALPHA).convert_alpha()
+            self._scratch[key] = surface
+        surface.fill(color)
+        return surface
+
+    def _get_dim_overlay(self, alpha: int) -> pygame.Surface:
+        """
+        Get a full-screen black overlay for darkening what's behind a menu
+        or dialog, filled once per alpha.
+
+        Args:
+            alpha: Overlay opacity (0-255)
+
+        Returns:
+            Overlay surface the size of the screen
+        """
+        overlay = self._dim_overlays.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA).convert_alpha()
+            overlay.fill((0, 0, 0, alpha))
+            self._dim_overlays[alpha] = overlay
+        return overlay
+
     def _init_fonts(self):
         """Initialize PlayStation-style fonts."""
         pygame.font.init()
@@ -146,8 +522,10 @@ class UIRenderer:
         font_names = ['Segoe UI', 'SF Pro Display', 'Helvetica Neue', 'Arial']
         font_name = None
 
+        # Normalize the installed font names once rather than per candidate
+        available = {f.lower().replace(' ', '') for f in pygame.font.get_fonts()}
         for name in font_names:
-            if name.lower().replace(' ', '') in [f.lower().replace(' ', '') for f in pygame.font.get_fonts()]:
+            if name.lower().replace(' ', '') in available:
                 font_name = name
                 break
 
@@ -166,18 +544,19 @@ class UIRenderer:
 
     def _create_gradient_background(self) -> pygame.Surface:
         """Create a vertical gradient background like PS5."""
-        surface = pygame.Surface((self.width, self.height))
-
-        for y in range(self.height):
-            # Calculate gradient color
-            ratio = y / self.height
-            r = int(Colors.BG_GRADIENT_TOP[0] + (Colors.BG_GRADIENT_BOTTOM[0] - Colors.BG_GRADIENT_TOP[0]) * ratio)
-            g = int(Colors.BG_GRADIENT_TOP[1] + (Colors.BG_GRADIENT_BOTTOM[1] - Colors.BG_GRADIENT_TOP[1]) * ratio)
-            b = int(Colors.BG_GRADIENT_TOP[2] + (Colors.BG_GRADIENT_BOTTOM[2] - Colors.BG_GRADIENT_TOP[2]) * ratio)
+        top, bottom = Colors.BG_GRADIENT_TOP, Colors.BG_GRADIENT_BOTTOM
+        rows = [
+            tuple(int(t + (b - t) * (y / self.height)) for t, b in zip(top, bottom))
+            for y in range(self.height)
+        ]
+        return _vertical_gradient(rows, self.width).convert()
 
-            pygame.draw.line(surface, (r, g, b), (0, y), (self.width, y))
-
-        return surface
+    @property
+    def default_icon(self) -> pygame.Surface:
+        """Default icon for games without art, created on first use."""
+        if self._default_icon is None:
+            self._default_icon = self._create_default_icon()
+        return self._default_icon
 
     def _create_default_icon(self) -> pygame.Surface:
         """Create a PlayStation-style default icon."""
@@ -211,63 +590,112 @@ class UIRenderer:
         # Action buttons (small circles)
         btn_x = center_x + int(size * 0.18)
         btn_size = int(size * 0.06)
-        for angle in [0, 90, 180, 270]:
-            bx = btn_x + int(math.cos(math.radians(angle)) * size * 0.08)
-            by = center_y + int(math.sin(math.radians(angle)) * size * 0.08)
-            pygame.draw.circle(surface, Colors.TEXT_GRAY, (bx, by), btn_size)
+        btn_spread = int(size * 0.08)
+        for dx, dy in ((btn_spread, 0), (0, btn_spread), (-btn_spread, 0), (0, -btn_spread)):
+            pygame.draw.circle(surface, Colors.TEXT_GRAY, (btn_x + dx, center_y + dy), btn_size)
 
-        return surface
+        return surface.convert_alpha()
 
     def load_icon(self, icon_path: Optional[str], size: Tuple[int, int] = None) -> pygame.Surface:
-        """Load and cache a game icon."""
+        """
+        Load and cache a game icon.
+        Images are decoded in the background so scrolling never waits on
+        disk or PIL; until a size is ready, a stand-in of that size is
+        returned and the icon appears on a later frame.
+
+        Args:
+            icon_path: Path to the image, or None for the default icon
+            size: (width, height) to fill; defaults to the tile's icon area
+
+        Returns:
+            Icon surface of exactly the given size, with rounded tile corners
+        """
         if size is None:
             size = (self.tile_width - 20, self.tile_height - 70)
 
-        cache_key = f"{icon_path}_{size[0]}x{size[1]}"
-        if cache_key in self.icon_cache:
-            return self.icon_cache[cache_key]
-
-        icon = None
-
-        if icon_path and os.path.exists(icon_path):
-            try:
-                # Use PIL for AVIF and other formats, then convert to pygame
-                if HAS_PIL and icon_path.lower().endswith(('.avif', '.webp', '.heic', '.heif')):
-                    pil_image = Image.open(icon_path)
-                    pil_image = pil_image.convert('RGBA')
-                    image_data = pil_image.tobytes()
-                    icon = pygame.image.fromstring(image_data, pil_image.size, 'RGBA')
-                else:
-                    icon = pygame.image.load(icon_path)
-
-                # Scale to fill the tile while maintaining aspect ratio
-                icon_rect = icon.get_rect()
-                scale = max(size[0] / icon_rect.width, size[1] / icon_rect.height)
-                new_size = (max(1, int(icon_rect.width * scale)), max(1, int(icon_rect.height * scale)))
-                icon = pygame.transform.smoothscale(icon, new_size)
-
-                # Crop to exact size if needed
-                if icon.get_width() >= size[0] and icon.get_height() >= size[1]:
-                    crop_rect = pygame.Rect(
-                        (icon.get_width() - size[0]) // 2,
-                        (icon.get_height() - size[1]) // 2,
-                        size[0], size[1]
-                    )
-                    icon = icon.subsurface(crop_rect).copy()
-                else:
-                    # If image is smaller, just scale to exact size
-                    icon = pygame.transform.smoothscale(icon, size)
-            except (pygame.error, ValueError, Exception):
-                icon = None
-
+        size = tuple(size)
+        icon = self.icon_cache.get((icon_path, size))
+        if icon is not None:
+            self.icon_cache.move_to_end((icon_path, size))
+            return icon
+
+        if not icon_path:
+            return self._store_icon(None, size, None)
+
+        job = self._icon_jobs.get(icon_path)
+        if job is not None and job[1].done():
+            del self._icon_jobs[icon_path]
+            self._icon_standins.pop(icon_path, None)
+            job_size, future = job
+            icon = self._store_icon(icon_path, job_size, future.result())
+            if job_size == size:
+                return icon
+            job = None
+
+        if job is None:
+            future = self._icon_pool.submit(_decode_icon, icon_path, size)
+            self._icon_jobs[icon_path] = (size, future)
+
+        # Stand-in until the job is done, scaled once rather than per frame
+        latest = self._latest_icons.get(icon_path)
+        if latest is None:
+            return self.load_icon(None, size)
+        standins = self._icon_standins.setdefault(icon_path, {})
+        standin = standins.get(size)
+        if standin is None:
+            standin = standins[size] = pygame.transform.scale(latest, size)
+        return standin
+
+    def _store_icon(self, icon_path: Optional[str], size: Tuple[int, int],
+                    icon: Optional[pygame.Surface]) -> pygame.Surface:
+        """
+        Finish a loaded icon and add it to the cache, evicting the least
+        recently used icon if the cache is full.
+
+        Args:
+            icon_path: Path the icon was loaded from, if any
+            size: (width, height) of the icon
+            icon: Decoded icon, or None to use the default icon
+
+        Returns:
+            The cached icon surface
+        """
         if icon is None:
             icon = pygame.transform.smoothscale(self.default_icon, size)
 
-        self.icon_cache[cache_key] = icon
+        # Cut the tile's rounded corners once here, rather than masking
+        # every tile every frame
+        rounded = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(rounded, (255, 255, 255, 255), (0, 0, *size),
+                         border_radius=self.TILE_CORNER_RADIUS)
+        rounded.blit(icon, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
+        # Match the display's pixel format once, so blits don't convert
+        # every frame
+        icon = rounded.convert_alpha()
+        self.icon_cache[(icon_path, size)] = icon
+        if icon_path:
+            self._latest_icons[icon_path] = icon
+
+        if len(self.icon_cache) > self.ICON_CACHE_SIZE:
+            (old_path, _), old_icon = self.icon_cache.popitem(last=False)
+            if self._latest_icons.get(old_path) is old_icon:
+                del self._latest_icons[old_path]
         return icon
 
+    def shutdown(self):
+        """Stop the icon loader threads, dropping icons not yet started."""
+        self._icon_pool.shutdown(wait=True, cancel_futures=True)
+        self._icon_jobs.clear()
+        self._icon_standins.clear()
+
     def clear_icon_cache(self):
         """Clear the icon cache."""
+        for _, future in self._icon_jobs.values():
+            future.cancel()
+        self._icon_jobs.clear()
+        self._icon_standins.clear()
+        self._latest_icons.clear()
         self.icon_cache.clear()
         self.background_cache.clear()
 
@@ -277,17 +705,11 @@ class UIRenderer:
             return None
 
         if bg_path in self.background_cache:
+            self.background_cache.move_to_end(bg_path)
             return self.background_cache[bg_path]
 
         try:
-            # Use PIL for AVIF and other formats
-            if HAS_PIL and bg_path.lower().endswith(('.avif', '.webp', '.heic', '.heif')):
-                pil_image = Image.open(bg_path)
-                pil_image = pil_image.convert('RGBA')
-                image_data = pil_image.tobytes()
-                bg = pygame.image.fromstring(image_data, pil_image.size, 'RGBA')
-            else:
-                bg = pygame.image.load(bg_path)
+            bg = _load_image(bg_path)
 
             # Scale to cover the entire screen
             bg_rect = bg.get_rect()
@@ -305,22 +727,28 @@ class UIRenderer:
                 crop_rect = pygame.Rect(crop_x, crop_y, crop_w, crop_h)
                 bg = bg.subsurface(crop_rect).copy()
 
-            # If still not exact size, scale to exact screen dimensions
+            # If still not exact size, scale to exact screen dimensions; the
+            # image was smoothscaled above, so a plain scale is enough here
             if bg.get_width() != self.width or bg.get_height() != self.height:
-                bg = pygame.transform.smoothscale(bg, (self.width, self.height))
+                bg = pygame.transform.scale(bg, (self.width, self.height))
 
             # Add subtle gradient at bottom for text readability (transparent to semi-dark)
-            gradient_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            gradient_height = 250
-            for i in range(gradient_height):
+            if self._background_shade is None:
+                gradient_height = 250
                 # Gradient from 0 alpha at top to 160 alpha at bottom
-                alpha = int(160 * (i / gradient_height) ** 1.5)  # Ease-in curve
-                pygame.draw.line(gradient_surface, (0, 0, 0, alpha),
-                               (0, self.height - gradient_height + i),
-                               (self.width, self.height - gradient_height + i))
-            bg.blit(gradient_surface, (0, 0))
+                rows = [(0, 0, 0, int(160 * (i / gradient_height) ** 1.5))  # Ease-in curve
+                        for i in range(gradient_height)]
+                self._background_shade = _vertical_gradient(rows, self.width)
+            bg.blit(self._background_shade,
+                    (0, self.height - self._background_shade.get_height()))
+
+            # Match the display's pixel format once, so blits don't convert
+            # every frame; keep the alpha of images that have any
+            bg = bg.convert_alpha() if bg.get_flags() & pygame.SRCALPHA else bg.convert()
 
             self.background_cache[bg_path] = bg
+            if len(self.background_cache) > self.BACKGROUND_CACHE_SIZE:
+                self.background_cache.popitem(last=False)
             return bg
         except pygame.error:
             return None
@@ -342,6 +770,9 @@ class UIRenderer:
         # Animate transition (fast and smooth)
         if self.background_transition < 1.0:
             self.background_transition = min(1.0, self.background_transition + 0.15)
+            # Done fading: draw the cached surface fully opaque again
+            if self.background_transition >= 1.0 and self.target_background:
+                self.target_background.set_alpha(None)
 
     def _render_background(self):
         """Render the current background with transition effect."""
@@ -350,23 +781,31 @@ class UIRenderer:
             self.screen.blit(self.target_background, (0, 0))
             return
 
-        # Draw gradient as base
-        self.screen.blit(self.gradient_bg, (0, 0))
+        # The cached surfaces are faded with their surface alpha rather
+        # than copied each frame; current and target are never the same one
+        current = self.current_background
+        if (current and self.target_background and self.background_transition < 1.0
+                and not current.get_flags() & pygame.SRCALPHA):
+            # Cross-fade: the outgoing background is opaque and covers the
+            # whole screen, so it's the base instead of the gradient
+            current.set_alpha(None)
+            self.screen.blit(current, (0, 0))
+        else:
+            # Draw gradient as base
+            self.screen.blit(self.gradient_bg, (0, 0))
 
-        # Draw current background (fading out)
-        if self.current_background and self.background_transition < 1.0:
-            bg_copy = self.current_background.copy()
-            bg_copy.set_alpha(int(255 * (1.0 - self.background_transition)))
-            self.screen.blit(bg_copy, (0, 0))
+            # Draw current background (fading out)
+            if current and self.background_transition < 1.0:
+                current.set_alpha(int(255 * (1.0 - self.background_transition)))
+                self.screen.blit(current, (0, 0))
 
         # Draw target background (fading in)
         if self.target_background and self.background_transition < 1.0:
-            bg_copy = self.target_background.copy()
-            bg_copy.set_alpha(int(255 * self.background_transition))
-            self.screen.blit(bg_copy, (0, 0))
+            self.target_background.set_alpha(int(255 * self.background_transition))
+            self.screen.blit(self.target_background, (0, 0))
 
     def render_main_screen(self, games: List[Game], selected_index: int,
-                           controller_connected: bool, button_prompts: Dict[str, str]):
+                           controller_connected: bool, button_prompts: ButtonPrompts):
         """Render the PlayStation-style main screen."""
         # Update and render dynamic background
         selected_game = games[selected_index] if games and selected_index < len(games) else None
@@ -374,9 +813,8 @@ class UIRenderer:
         self._render_background()
 
         # Update and draw particles
-        for particle in self.particles:
-            particle.update()
-            particle.draw(self.screen)
+        steps = self._animation_steps()
+        self._draw_particles(steps)
 
         if not games:
             self._render_no_games_message()
@@ -390,8 +828,38 @@ class UIRenderer:
         self._render_message()
 
         # Update animations
-        self.selection_animation = (self.selection_animation + 0.08) % (2 * math.pi)
-        self.glow_animation = (self.glow_animation + 0.05) % (2 * math.pi)
+        self.selection_animation = (self.selection_animation + 0.08 * steps) % (2 * math.pi)
+        self.glow_animation = (self.glow_animation + 0.05 * steps) % (2 * math.pi)
+
+    def _draw_particles(self, steps: float):
+        """Move the background particles and draw them in one batched blit."""
+        for particle in self.particles:
+            particle.update(steps)
+        self.screen.blits([(p.sprite, (int(p.x), int(p.y))) for p in self.particles],
+                          doreturn=False)
+
+    def _animation_steps(self) -> float:
+        """Number of 60 FPS frames elapsed since the last animated draw."""
+        now = pygame.time.get_ticks()
+        steps = (now - self._last_animation_tick) / self.ANIMATION_FRAME_MS
+        self._last_animation_tick = now
+        return min(steps, self.MAX_ANIMATION_STEPS)
+
+    def is_animating(self) -> bool:
+        """
+        Check whether a transition is in progress that needs full-rate redraws.
+        The ambient particles don't count; they look fine at a lower rate.
+
+        Returns:
+            True while scrolling, fading backgrounds, loading icons or
+            showing a message
+        """
+        if self.scroll_offset != self.target_scroll_offset or self.background_transition < 1.0:
+            return True
+        if any(not future.done() for _, future in self._icon_jobs.values()):
+            return True
+        return (self.message is not None
+                and pygame.time.get_ticks() - self.message_time <= self.message_duration)
 
     def _update_scroll(self, selected_index: int, total_games: int):
         """Update scroll offset for smooth PS5-style scrolling."""
@@ -413,11 +881,19 @@ class UIRenderer:
         tile_total_width = self.tile_width + self.tile_spacing
         y_position = (self.height - self.tile_height) // 2 - 40
 
-        for i, game in enumerate(games):
+        # Only visit the tiles near the screen; the exact check below still
+        # decides, the range just has to cover every visible tile
+        left_cull = -self.tile_width - 100
+        right_cull = self.width + 100
+        first = max(0, math.floor((left_cull - self.scroll_offset) / tile_total_width))
+        last = min(len(games), math.ceil((right_cull - self.scroll_offset) / tile_total_width) + 1)
+
+        for i in range(first, last):
+            game = games[i]
             x_position = int(self.scroll_offset + (i * tile_total_width))
 
             # Skip if off screen
-            if x_position < -self.tile_width - 100 or x_position > self.width + 100:
+            if x_position < left_cull or x_position > right_cull:
                 continue
 
             is_selected = (i == selected_index)
@@ -435,7 +911,7 @@ class UIRenderer:
             # Fade out tiles further from center
             fade_start = self.width * 0.3
             fade = max(0, min(1, 1 - (distance - fade_start) / (self.width * 0.4)))
-            scale = 0.9 + 0.1 * fade
+            scale = 0.9 + round(0.1 * fade / self.TILE_SCALE_STEP) * self.TILE_SCALE_STEP
             opacity = int(120 + 135 * fade)
 
         scaled_width = int(self.tile_width * scale)
@@ -450,41 +926,43 @@ class UIRenderer:
         if is_selected:
             self._draw_glow(tile_x, tile_y, scaled_width, scaled_height, 100)
 
-        # Load game poster (or fall back to icon) - full tile size
+        # Load game poster (or fall back to icon) - full tile size, with
+        # the rounded corners already applied
         image_path = game.poster_path or game.icon_path
         poster = self.load_icon(image_path, (scaled_width, scaled_height))
 
-        # Create tile surface with rounded corners
-        tile_surface = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-
-        # Draw rounded rectangle mask
-        pygame.draw.rect(tile_surface, (255, 255, 255, opacity),
-                        (0, 0, scaled_width, scaled_height), border_radius=12)
-
-        # Apply poster with mask
+        # Fade with the surface alpha; it's set before every blit, so
+        # sharing the cached poster between tiles is fine
         poster.set_alpha(opacity)
-        tile_surface.blit(poster, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        self.screen.blit(poster, (tile_x, tile_y))
 
         # Draw selection border
         if is_selected:
-            pygame.draw.rect(tile_surface, (*Colors.GLOW_INNER, 255),
-                           (0, 0, scaled_width, scaled_height),
-                           width=3, border_radius=12)
-
-        self.screen.blit(tile_surface, (tile_x, tile_y))
+            pygame.draw.rect(self.screen, Colors.GLOW_INNER,
+                           (tile_x, tile_y, scaled_width, scaled_height),
+                           width=3, border_radius=self.TILE_CORNER_RADIUS)
 
     def _draw_glow(self, x: int, y: int, width: int, height: int, intensity: int):
         """Draw a glowing effect around a rectangle."""
         glow_size = 25
-        glow_surface = pygame.Surface((width + glow_size * 2, height + glow_size * 2), pygame.SRCALPHA)
 
-        # Multiple layers of glow
-        for i in range(glow_size, 0, -3):
-            alpha = int((intensity * (glow_size - i) / glow_size))
-            color = (*Colors.PS_BLUE_GLOW, alpha)
-            pygame.draw.rect(glow_surface, color,
-                           (glow_size - i, glow_size - i, width + i * 2, height + i * 2),
-                           border_radius=20 + i)
+        # Only a few tile sizes get selected, so the glow is drawn once per
+        # size and reused
+        key = (width, height, intensity)
+        glow_surface = self.glow_cache.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((width + glow_size * 2, height + glow_size * 2), pygame.SRCALPHA)
+
+            # Multiple layers of glow
+            for i in range(glow_size, 0, -3):
+                alpha = int((intensity * (glow_size - i) / glow_size))
+                color = (*Colors.PS_BLUE_GLOW, alpha)
+                pygame.draw.rect(glow_surface, color,
+                               (glow_size - i, glow_size - i, width + i * 2, height + i * 2),
+                               border_radius=20 + i)
+
+            glow_surface = glow_surface.convert_alpha()
+            self.glow_cache[key] = glow_surface
 
         self.screen.blit(glow_surface, (x - glow_size, y - glow_size))
 
@@ -493,53 +971,38 @@ class UIRenderer:
         bar_height = 120
         bar_y = self.height - bar_height - 60
 
-        # Semi-transparent bar background
-        bar_surface = pygame.Surface((self.width, bar_height), pygame.SRCALPHA)
+        # Semi-transparent bar background, fading from transparent to
+        # semi-opaque
+        if self._info_bar_gradient is None:
+            rows = [(10, 10, 20, int(150 * (i / bar_height))) for i in range(bar_height)]
+            self._info_bar_gradient = _vertical_gradient(rows, self.width).convert_alpha()
 
-        # Gradient fade from transparent to semi-opaque
-        for i in range(bar_height):
-            alpha = int(150 * (i / bar_height))
-            pygame.draw.line(bar_surface, (10, 10, 20, alpha), (0, i), (self.width, i))
-
-        self.screen.blit(bar_surface, (0, bar_y))
+        self.screen.blit(self._info_bar_gradient, (0, bar_y))
 
         # Game title - large and bold
-        title_surface = self.font_large.render(game.name, True, Colors.TEXT_WHITE)
+        title_surface = self._render_text(self.font_large, game.name, Colors.TEXT_WHITE)
         self.screen.blit(title_surface, (60, bar_y + 20))
 
         # Subtitle info (play count, last played)
-        info_parts = []
-        if game.play_count > 0:
-            info_parts.append(f"Played {game.play_count} time{'s' if game.play_count != 1 else ''}")
-        if game.last_played:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(game.last_played)
-                info_parts.append(f"Last played {dt.strftime('%B %d, %Y')}")
-            except ValueError:
-                pass
-
-        if info_parts:
-            info_text = "  |  ".join(info_parts)
-            info_surface = self.font_small.render(info_text, True, Colors.TEXT_GRAY)
+        info_text = _format_play_info(game.play_count, game.last_played)
+        if info_text:
+            info_surface = self._render_text(self.font_small, info_text, Colors.TEXT_GRAY)
             self.screen.blit(info_surface, (60, bar_y + 70))
 
     def _render_header(self, game_count: int, controller_connected: bool):
         """Render PS5-style minimal header."""
+        if self._header_static is None:
+            self._header_static = self._build_header_static()
+        header_surface, title_surface = self._header_static
+
         # Top gradient overlay for readability
-        header_surface = pygame.Surface((self.width, 100), pygame.SRCALPHA)
-        for i in range(100):
-            alpha = int(100 * (1 - i / 100))
-            pygame.draw.line(header_surface, (10, 10, 20, alpha), (0, i), (self.width, i))
         self.screen.blit(header_surface, (0, 0))
 
         # Library title (left side)
-        title = "Game Library"
-        title_surface = self.font_medium.render(title, True, Colors.TEXT_WHITE)
         self.screen.blit(title_surface, (40, 35))
 
         # Game count
-        count_surface = self.font_tiny.render(f"{game_count} Games", True, Colors.TEXT_GRAY)
+        count_surface = self._render_text(self.font_tiny, f"{game_count} Games", Colors.TEXT_GRAY)
         self.screen.blit(count_surface, (40 + title_surface.get_width() + 20, 42))
 
         # Controller status (right side) - PS5 style indicator
@@ -553,50 +1016,79 @@ class UIRenderer:
         # Small dot indicator
         pygame.draw.circle(self.screen, status_color,
                           (self.width - 180, 45), 6)
-        status_surface = self.font_tiny.render(status_text, True, status_color)
+        status_surface = self._render_text(self.font_tiny, status_text, status_color)
         self.screen.blit(status_surface, (self.width - 165, 38))
 
-    def _render_footer(self, button_prompts: Dict[str, str]):
-        """Render PS5-style button prompts footer."""
-        footer_y = self.height - 45
+    def _build_header_static(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Pre-render the parts of the header that never change.
+
+        Returns:
+            Tuple of (top gradient overlay, library title text)
+        """
+        rows = [(10, 10, 20, int(100 * (1 - i / 100))) for i in range(100)]
+        gradient = _vertical_gradient(rows, self.width).convert_alpha()
+        title_surface = self.font_medium.render("Game Library", True, Colors.TEXT_WHITE)
+        return gradient, title_surface
 
+    def _render_footer(self, button_prompts: ButtonPrompts):
+        """Render PS5-style button prompts footer."""
         # Define button icons and actions
-        prompts = [
-            (button_prompts.get('confirm', 'X'), "Select"),
-            (button_prompts.get('back', 'O'), "Back"),
-            (button_prompts.get('options', 'OPTIONS'), "Options"),
-        ]
+        prompts = (button_prompts.confirm, button_prompts.back, button_prompts.options)
+
+        # The prompts only change when a controller (dis)connects
+        if prompts != self._footer_prompts:
+            self._footer_blits = self._build_footer(prompts)
+            self._footer_prompts = prompts
+
+        self.screen.blits(self._footer_blits, doreturn=False)
+
+    def _build_footer(self, prompts: Tuple[str, ...]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Pre-render the footer's button prompts.
+
+        Args:
+            prompts: Button labels for Select, Back and Options
+
+        Returns:
+            List of (surface, position) to blit, in drawing order
+        """
+        footer_y = self.height - 45
+        blits = []
 
         # Calculate positions (right-aligned like PS5)
         x = self.width - 40
 
-        for button, action in reversed(prompts):
+        actions = ("Select", "Back", "Options")
+        for button, action in zip(reversed(prompts), reversed(actions)):
             # Action text
             action_surface = self.font_tiny.render(action, True, Colors.TEXT_GRAY)
             x -= action_surface.get_width()
-            self.screen.blit(action_surface, (x, footer_y))
+            blits.append((action_surface, (x, footer_y)))
 
             # Button icon/text
             x -= 10
             btn_surface = self.font_tiny.render(button, True, Colors.TEXT_WHITE)
             x -= btn_surface.get_width()
 
-            # Draw button background circle/pill
+            # Button background pill with the label drawn on it
             btn_bg_width = btn_surface.get_width() + 16
-            btn_bg_rect = (x - 8, footer_y - 4, btn_bg_width, 26)
-            pygame.draw.rect(self.screen, Colors.TILE_BG, btn_bg_rect, border_radius=13)
-            pygame.draw.rect(self.screen, Colors.DIVIDER, btn_bg_rect, width=1, border_radius=13)
-
-            self.screen.blit(btn_surface, (x, footer_y))
+            pill = pygame.Surface((btn_bg_width, 26), pygame.SRCALPHA)
+            pygame.draw.rect(pill, Colors.TILE_BG, (0, 0, btn_bg_width, 26), border_radius=13)
+            pygame.draw.rect(pill, Colors.DIVIDER, (0, 0, btn_bg_width, 26), width=1, border_radius=13)
+            pill.blit(btn_surface, (8, 4))
+            blits.append((pill.convert_alpha(), (x - 8, footer_y - 4)))
             x -= 30
 
+        return blits
+
     def _render_no_games_message(self):
         """Render PS5-style empty state message."""
-        center_y = self.height // 2
+        center_y = self.center_y
 
         # Icon placeholder
         icon_size = 120
-        icon_rect = (self.width // 2 - icon_size // 2, center_y - 120, icon_size, icon_size)
+        icon_rect = (self.center_x - icon_size // 2, center_y - 120, icon_size, icon_size)
         pygame.draw.rect(self.screen, Colors.TILE_BG, icon_rect, border_radius=20)
 
         # Folder icon
@@ -608,14 +1100,14 @@ class UIRenderer:
                         border_radius=5, width=3)
 
         # Title
-        title_surface = self.font_large.render("No Games Found", True, Colors.TEXT_WHITE)
-        title_rect = title_surface.get_rect(centerx=self.width // 2, top=center_y + 20)
+        title_surface = self._render_text(self.font_large, "No Games Found", Colors.TEXT_WHITE)
+        title_rect = title_surface.get_rect(centerx=self.center_x, top=center_y + 20)
         self.screen.blit(title_surface, title_rect)
 
         # Subtitle
         subtitle = "Go to Options to add game folders"
-        sub_surface = self.font_medium.render(subtitle, True, Colors.TEXT_GRAY)
-        sub_rect = sub_surface.get_rect(centerx=self.width // 2, top=center_y + 75)
+        sub_surface = self._render_text(self.font_medium, subtitle, Colors.TEXT_GRAY)
+        sub_rect = sub_surface.get_rect(centerx=self.center_x, top=center_y + 75)
         self.screen.blit(sub_surface, sub_rect)
 
     def _render_text_with_alpha(self, text: str, x: int, y: int, font: pygame.font.Font,
@@ -623,8 +1115,7 @@ class UIRenderer:
                                  center: bool = False):
         """Render text with transparency support."""
         if max_width:
-            while font.size(text)[0] > max_width and len(text) > 3:
-                text = text[:-4] + "..."
+            text = _fit_text(font, text, max_width)
 
         surface = font.render(text, True, color)
         surface.set_alpha(alpha)
@@ -641,10 +1132,9 @@ class UIRenderer:
                               max_width: int = None):
         """Render text centered at a position."""
         if max_width:
-            while font.size(text)[0] > max_width and len(text) > 3:
-                text = text[:-4] + "..."
+            text = _fit_text(font, text, max_width)
 
-        surface = font.render(text, True, color)
+        surface = self._render_text(font, text, color)
         rect = surface.get_rect(centerx=x, top=y)
         self.screen.blit(surface, rect)
 
@@ -689,7 +1179,7 @@ class UIRenderer:
         toast_y = 100
 
         # Background
-        toast_surface = pygame.Surface((toast_width, toast_height), pygame.SRCALPHA)
+        toast_surface = self._get_scratch(toast_width, toast_height)
         pygame.draw.rect(toast_surface, (*Colors.TILE_BG, alpha),
                         (0, 0, toast_width, toast_height), border_radius=10)
         pygame.draw.rect(toast_surface, (*Colors.PS_BLUE, alpha),
@@ -702,37 +1192,70 @@ class UIRenderer:
         self.screen.blit(text_surface, (toast_x + padding, toast_y + 12))
 
     def render_settings_menu(self, settings: Dict[str, Any], selected_option: int,
-                             button_prompts: Dict[str, str]):
+                             button_prompts: ButtonPrompts):
         """Render PS5-style settings overlay."""
         # Full screen overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 230))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_dim_overlay(230), (0, 0))
 
         # Settings panel (right side slide-in style like PS5)
-        panel_width = 700
-        panel_x = (self.width - panel_width) // 2
-        panel_y = 80
-        panel_height = self.height - 160
+        panel_x, panel_y, panel_width, panel_height = self._settings_panel_rect()
 
         # Panel background
         pygame.draw.rect(self.screen, Colors.TILE_BG,
                         (panel_x, panel_y, panel_width, panel_height),
                         border_radius=20)
 
-        # Title
-        title_surface = self.font_large.render("Settings", True, Colors.TEXT_WHITE)
-        self.screen.blit(title_surface, (panel_x + 40, panel_y + 30))
-
         # Divider
         pygame.draw.line(self.screen, Colors.DIVIDER,
                         (panel_x + 40, panel_y + 90), (panel_x + panel_width - 40, panel_y + 90), 2)
 
+        # Values of the options that show a setting
+        values = (
+            _format_folders(tuple(settings.get('game_folders', ()))),
+            "Fullscreen" if settings.get('window', {}).get('fullscreen', False) else "Windowed",
+            settings.get('sorting', 'alphabetical').title(),
+        )
+
+        # The menu's contents only change with a setting, the selection or
+        # the controller's button glyphs
+        key = (values, selected_option, button_prompts)
+        if key != self._settings_key:
+            self._settings_blits = self._build_settings_blits(values, selected_option, button_prompts)
+            self._settings_key = key
+
+        self.screen.blits(self._settings_blits, doreturn=False)
+
+    def _settings_panel_rect(self) -> Tuple[int, int, int, int]:
+        """Get the settings panel's (x, y, width, height) on the screen."""
+        panel_width = 700
+        return self.center_x - panel_width // 2, 80, panel_width, self.height - 160
+
+    def _build_settings_blits(self, values: Tuple[str, ...], selected_option: int,
+                              button_prompts: ButtonPrompts) -> List[Tuple[pygame.Surface, Any]]:
+        """
+        Lay out the settings menu's highlight and text.
+
+        Args:
+            values: Values shown for Game Folders, Display Mode and Sort By
+            selected_option: Index of the selected option
+            button_prompts: Button labels for the current input method
+
+        Returns:
+            List of (surface, position) pairs for Surface.blits()
+        """
+        panel_x, panel_y, panel_width, panel_height = self._settings_panel_rect()
+
+        # The highlight goes first so the text is drawn over it; none of
+        # the text overlaps another option
+        blits = []
+        title_surface = self._render_text(self.font_large, "Settings", Colors.TEXT_WHITE)
+        text_blits = [(title_surface, (panel_x + 40, panel_y + 30))]
+
         # Settings options
         options = [
-            ("Game Folders", self._format_folders(settings.get('game_folders', [])), "folder"),
-            ("Display Mode", "Fullscreen" if settings.get('window', {}).get('fullscreen', False) else "Windowed", "display"),
-            ("Sort By", settings.get('sorting', 'alphabetical').title(), "sort"),
+            ("Game Folders", values[0], "folder"),
+            ("Display Mode", values[1], "display"),
+            ("Sort By", values[2], "sort"),
             ("Rescan Library", "Search for new games", "refresh"),
             ("Back", "Return to library", "back"),
         ]
@@ -740,110 +1263,155 @@ class UIRenderer:
         option_y = panel_y + 120
         option_height = 70
 
+        # Looked up once for the loop below
+        render_text = self._render_text
+        add_text = text_blits.append
+        label_font, value_font = self.font_medium, self.font_small
+
         for i, (label, value, icon_type) in enumerate(options):
             is_selected = (i == selected_option)
             option_rect = (panel_x + 20, option_y, panel_width - 40, option_height)
 
             # Selection highlight
             if is_selected:
-                # Glow effect
-                glow_surf = pygame.Surface((option_rect[2] + 10, option_rect[3] + 10), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (*Colors.PS_BLUE, 40),
-                               (0, 0, option_rect[2] + 10, option_rect[3] + 10), border_radius=15)
-                self.screen.blit(glow_surf, (option_rect[0] - 5, option_rect[1] - 5))
-
-                pygame.draw.rect(self.screen, Colors.TILE_SELECTED, option_rect, border_radius=12)
-                pygame.draw.rect(self.screen, Colors.PS_BLUE, option_rect, width=2, border_radius=12)
+                if self._option_highlight is None:
+                    self._option_highlight = self._build_option_highlight(option_rect[2], option_rect[3])
+                blits.append((self._option_highlight, (option_rect[0] - 5, option_rect[1] - 5)))
 
             # Label
             label_color = Colors.TEXT_WHITE if is_selected else Colors.TEXT_LIGHT
-            label_surface = self.font_medium.render(label, True, label_color)
-            self.screen.blit(label_surface, (panel_x + 60, option_y + 12))
+            label_surface = render_text(label_font, label, label_color)
+            add_text((label_surface, (panel_x + 60, option_y + 12)))
 
             # Value (right aligned)
             if value:
                 value_color = Colors.TEXT_GRAY if is_selected else Colors.TEXT_MUTED
-                value_surface = self.font_small.render(value, True, value_color)
+                value_surface = render_text(value_font, value, value_color)
                 value_x = panel_x + panel_width - value_surface.get_width() - 60
-                self.screen.blit(value_surface, (value_x, option_y + 24))
+                add_text((value_surface, (value_x, option_y + 24)))
 
             option_y += option_height + 10
 
         # Footer prompts
         footer_y = panel_y + panel_height - 50
-        prompt_text = f"{button_prompts.get('confirm', 'X')} Select    {button_prompts.get('back', 'O')} Back"
-        prompt_surface = self.font_small.render(prompt_text, True, Colors.TEXT_GRAY)
-        prompt_rect = prompt_surface.get_rect(centerx=self.width // 2, top=footer_y)
-        self.screen.blit(prompt_surface, prompt_rect)
-
-    def _format_folders(self, folders: List[str]) -> str:
-        """Format folder list for display."""
-        if not folders:
-            return "Not configured"
-        if len(folders) == 1:
-            return Path(folders[0]).name
-        return f"{len(folders)} folders"
+        prompt_surface = self._render_prompt(self.SETTINGS_PROMPT, button_prompts,
+                                             self.font_small, Colors.TEXT_GRAY)
+        prompt_rect = prompt_surface.get_rect(centerx=self.center_x, top=footer_y)
+        text_blits.append((prompt_surface, prompt_rect))
+
+        return blits + text_blits
+
+    def _build_option_highlight(self, width: int, height: int) -> pygame.Surface:
+        """
+        Pre-render the selected settings option's highlight.
+
+        Args:
+            width: Width of the option
+            height: Height of the option
+
+        Returns:
+            Surface with the glow, fill and border, 5 pixels larger than the
+            option on each side
+        """
+        surface = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
+
+        # Glow effect
+        pygame.draw.rect(surface, (*Colors.PS_BLUE, 40),
+                        (0, 0, width + 10, height + 10), border_radius=15)
+
+        option_rect = (5, 5, width, height)
+        pygame.draw.rect(surface, Colors.TILE_SELECTED, option_rect, border_radius=12)
+        pygame.draw.rect(surface, Colors.PS_BLUE, option_rect, width=2, border_radius=12)
+        return surface.convert_alpha()
 
     def render_loading_screen(self, message: str, progress: float = -1):
         """Render PS5-style loading screen."""
         self.screen.blit(self.gradient_bg, (0, 0))
 
         # Update particles
-        for particle in self.particles:
-            particle.update()
-            particle.draw(self.screen)
+        self._draw_particles(self._animation_steps())
 
-        center_x = self.width // 2
-        center_y = self.height // 2
+        center_x = self.center_x
+        center_y = self.center_y
 
         # Loading spinner or progress
         spinner_radius = 40
         spinner_thickness = 4
 
         if progress < 0:
-            # Spinning animation
-            angle = (pygame.time.get_ticks() / 5) % 360
-            for i in range(12):
-                segment_angle = math.radians(angle + i * 30)
-                alpha = int(255 * (12 - i) / 12)
-                start_r = spinner_radius - 10
-                end_r = spinner_radius
-
-                start_x = center_x + int(math.cos(segment_angle) * start_r)
-                start_y = center_y - 60 + int(math.sin(segment_angle) * start_r)
-                end_x = center_x + int(math.cos(segment_angle) * end_r)
-                end_y = center_y - 60 + int(math.sin(segment_angle) * end_r)
-
-                pygame.draw.line(self.screen, (*Colors.PS_BLUE_LIGHT, alpha),
-                               (start_x, start_y), (end_x, end_y), spinner_thickness)
+            # Spinning animation, turning in whole degrees. The spokes
+            # look the same every 30 degrees, so each step is drawn once
+            phase = (pygame.time.get_ticks() // 5) % 30
+            spinner = self.spinner_cache.get(phase)
+            if spinner is None:
+                spinner = self._build_spinner(phase, spinner_radius, spinner_thickness)
+                self.spinner_cache[phase] = spinner
+            offset = spinner.get_width() // 2
+            self.screen.blit(spinner, (center_x - offset, center_y - 60 - offset))
         else:
             # Progress ring
             pygame.draw.circle(self.screen, Colors.TILE_BG, (center_x, center_y - 60), spinner_radius, spinner_thickness)
 
             if progress > 0:
                 end_angle = -90 + (360 * progress)
-                # Draw progress arc
-                for angle in range(int(-90), int(end_angle)):
-                    rad = math.radians(angle)
-                    x = center_x + int(math.cos(rad) * spinner_radius)
-                    y = center_y - 60 + int(math.sin(rad) * spinner_radius)
-                    pygame.draw.circle(self.screen, Colors.PS_BLUE_LIGHT, (x, y), spinner_thickness // 2)
+                # Draw progress arc as one filled band with round ends.
+                # pygame.draw.arc would be simpler, but leaves pinholes in
+                # arcs this thick
+                arc = _UNIT_CIRCLE[:int(end_angle) + 90]
+                if arc:
+                    half = spinner_thickness // 2
+                    cy = center_y - 60
+                    outer = spinner_radius + half - 1
+                    inner = spinner_radius - half
+                    # A one-degree arc has no band, just its end cap
+                    if len(arc) >= 2:
+                        points = [(center_x + cos_a * outer, cy + sin_a * outer) for cos_a, sin_a in arc]
+                        points += [(center_x + cos_a * inner, cy + sin_a * inner)
+                                   for cos_a, sin_a in reversed(arc)]
+                        pygame.draw.polygon(self.screen, Colors.PS_BLUE_LIGHT, points)
+                    for cos_a, sin_a in (arc[0], arc[-1]):
+                        pygame.draw.circle(self.screen, Colors.PS_BLUE_LIGHT,
+                                           (center_x + int(cos_a * spinner_radius),
+                                            cy + int(sin_a * spinner_radius)), half)
 
         # Loading text
-        text_surface = self.font_medium.render(message, True, Colors.TEXT_WHITE)
+        text_surface = self._render_text(self.font_medium, message, Colors.TEXT_WHITE)
         text_rect = text_surface.get_rect(center=(center_x, center_y + 20))
         self.screen.blit(text_surface, text_rect)
 
-    def render_error_screen(self, title: str, message: str, button_prompts: Dict[str, str]):
-        """Render PS5-style error screen."""
-        self.screen.blit(self.gradient_bg, (0, 0))
-
-        center_x = self.width // 2
-        center_y = self.height // 2
-
-        # Error icon - triangle with exclamation
-        icon_size = 80
-        icon_y = center_y - 100
+    def _build_spinner(self, angle: int, radius: int, thickness: int) -> pygame.Surface:
+        """
+        Pre-render the loading spinner's 12 spokes at one rotation.
+        The spokes are solid: the display has no per-pixel alpha, so they
+        never faded along the ring when drawn onto it directly.
+
+        Args:
+            angle: Rotation in degrees
+            radius: Outer radius of the spokes
+            thickness: Width of each spoke
+
+        Returns:
+            Square surface with the spinner centered on it
+        """
+        center = radius + thickness
+        surface = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+        start_r = radius - 10
+        for i in range(12):
+            cos_a, sin_a = _UNIT_CIRCLE[(angle + i * 30 + 90) % 360]
+            start = (center + int(cos_a * start_r), center + int(sin_a * start_r))
+            end = (center + int(cos_a * radius), center + int(sin_a * radius))
+            pygame.draw.line(surface, Colors.PS_BLUE_LIGHT, start, end, thickness)
+        return surface.convert_alpha()
+
+    def _build_error_icon(self) -> pygame.Surface:
+        """
+        Pre-render the error screen's warning icon.
+
+        Returns:
+            Icon surface, centered on ERROR_ICON_CENTER
+        """
+        surface = pygame.Surface(self.ERROR_ICON_SIZE, pygame.SRCALPHA)
+        center_x, icon_y = self.ERROR_ICON_CENTER
 
         # Triangle
         points = [
@@ -851,59 +1419,94 @@ class UIRenderer:
             (center_x - 40, icon_y + 30),
             (center_x + 40, icon_y + 30)
         ]
-        pygame.draw.polygon(self.screen, Colors.ERROR, points, width=4)
+        pygame.draw.polygon(surface, Colors.ERROR, points, width=4)
 
         # Exclamation
-        pygame.draw.line(self.screen, Colors.ERROR,
+        pygame.draw.line(surface, Colors.ERROR,
                         (center_x, icon_y - 10), (center_x, icon_y + 5), 4)
-        pygame.draw.circle(self.screen, Colors.ERROR, (center_x, icon_y + 18), 4)
+        pygame.draw.circle(surface, Colors.ERROR, (center_x, icon_y + 18), 4)
+        return surface.convert_alpha()
 
-        # Title
-        title_surface = self.font_large.render(title, True, Colors.TEXT_WHITE)
-        title_rect = title_surface.get_rect(center=(center_x, center_y + 10))
-        self.screen.blit(title_surface, title_rect)
+    def render_error_screen(self, title: str, message: str, button_prompts: ButtonPrompts):
+        """Render PS5-style error screen."""
+        self.screen.blit(self.gradient_bg, (0, 0))
 
-        # Message
-        msg_surface = self.font_medium.render(message, True, Colors.TEXT_GRAY)
-        msg_rect = msg_surface.get_rect(center=(center_x, center_y + 60))
-        self.screen.blit(msg_surface, msg_rect)
+        center_x = self.center_x
+        center_y = self.center_y
 
-        # Prompt
-        prompt_text = f"Press {button_prompts.get('confirm', 'X')} to continue"
-        prompt_surface = self.font_small.render(prompt_text, True, Colors.TEXT_MUTED)
-        prompt_rect = prompt_surface.get_rect(center=(center_x, center_y + 130))
-        self.screen.blit(prompt_surface, prompt_rect)
+        # Error icon - triangle with exclamation
+        icon_y = center_y - 100
+        if self._error_icon is None:
+            self._error_icon = self._build_error_icon()
+        self.screen.blit(self._error_icon, (center_x - self.ERROR_ICON_CENTER[0],
+                                            icon_y - self.ERROR_ICON_CENTER[1]))
+
+        # Title, message and prompt, drawn in one batch
+        title_surface = self._render_text(self.font_large, title, Colors.TEXT_WHITE)
+        msg_surface = self._render_text(self.font_medium, message, Colors.TEXT_GRAY)
+        prompt_surface = self._render_prompt(self.CONTINUE_PROMPT, button_prompts,
+                                             self.font_small, Colors.TEXT_MUTED)
+        self.screen.blits((
+            (title_surface, title_surface.get_rect(center=(center_x, center_y + 10))),
+            (msg_surface, msg_surface.get_rect(center=(center_x, center_y + 60))),
+            (prompt_surface, prompt_surface.get_rect(center=(center_x, center_y + 130))),
+        ), doreturn=False)
+
+    def _build_dialog_chrome(self, width: int, height: int, button_width: int,
+                             button_height: int) -> Tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
+        """
+        Pre-render the confirmation dialog's box and button backgrounds.
+
+        Args:
+            width: Dialog width
+            height: Dialog height
+            button_width: Width of each button
+            button_height: Height of each button
+
+        Returns:
+            Tuple of (dialog box, yes button background, no button background)
+        """
+        box_rect = (0, 0, width, height)
+        box_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(box_surface, Colors.TILE_BG, box_rect, border_radius=16)
+        pygame.draw.rect(box_surface, Colors.DIVIDER, box_rect, width=1, border_radius=16)
+
+        button_rect = (0, 0, button_width, button_height)
+        radius = button_height // 2
+        yes_bg = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
+        pygame.draw.rect(yes_bg, Colors.PS_BLUE, button_rect, border_radius=radius)
+        no_bg = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
+        pygame.draw.rect(no_bg, Colors.TILE_HOVER, button_rect, border_radius=radius)
+        pygame.draw.rect(no_bg, Colors.DIVIDER, button_rect, width=1, border_radius=radius)
+
+        return box_surface.convert_alpha(), yes_bg.convert_alpha(), no_bg.convert_alpha()
 
     def render_confirmation_dialog(self, title: str, message: str,
-                                   button_prompts: Dict[str, str]) -> None:
+                                   button_prompts: ButtonPrompts) -> None:
         """Render PS5-style confirmation dialog."""
         # Darken background
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_dim_overlay(200), (0, 0))
 
         # Dialog box
         dialog_width = 500
         dialog_height = 220
-        dialog_x = (self.width - dialog_width) // 2
-        dialog_y = (self.height - dialog_height) // 2
+        dialog_x = self.center_x - dialog_width // 2
+        dialog_y = self.center_y - dialog_height // 2
 
-        # Background with subtle border
-        pygame.draw.rect(self.screen, Colors.TILE_BG,
-                        (dialog_x, dialog_y, dialog_width, dialog_height),
-                        border_radius=16)
-        pygame.draw.rect(self.screen, Colors.DIVIDER,
-                        (dialog_x, dialog_y, dialog_width, dialog_height),
-                        width=1, border_radius=16)
+        # Background with subtle border, and the button backgrounds
+        if self._dialog_chrome is None:
+            self._dialog_chrome = self._build_dialog_chrome(dialog_width, dialog_height, 100, 36)
+        box_surface, yes_bg, no_bg = self._dialog_chrome
+        self.screen.blit(box_surface, (dialog_x, dialog_y))
 
         # Title
-        title_surface = self.font_medium.render(title, True, Colors.TEXT_WHITE)
-        title_rect = title_surface.get_rect(centerx=self.width // 2, top=dialog_y + 35)
+        title_surface = self._render_text(self.font_medium, title, Colors.TEXT_WHITE)
+        title_rect = title_surface.get_rect(centerx=self.center_x, top=dialog_y + 35)
         self.screen.blit(title_surface, title_rect)
 
         # Message
-        msg_surface = self.font_small.render(message, True, Colors.TEXT_GRAY)
-        msg_rect = msg_surface.get_rect(centerx=self.width // 2, top=dialog_y + 85)
+        msg_surface = self._render_text(self.font_small, message, Colors.TEXT_GRAY)
+        msg_rect = msg_surface.get_rect(centerx=self.center_x, top=dialog_y + 85)
         self.screen.blit(msg_surface, msg_rect)
 
         # Button row
@@ -911,18 +1514,17 @@ class UIRenderer:
         btn_spacing = 140
 
         # Yes button
-        yes_text = f"{button_prompts.get('confirm', 'X')} Yes"
-        yes_surface = self.font_small.render(yes_text, True, Colors.TEXT_WHITE)
-        yes_rect = (self.width // 2 - btn_spacing - 50, btn_y, 100, 36)
-        pygame.draw.rect(self.screen, Colors.PS_BLUE, yes_rect, border_radius=18)
+        yes_surface = self._render_prompt(self.YES_PROMPT, button_prompts,
+                                          self.font_small, Colors.TEXT_WHITE)
+        yes_rect = (self.center_x - btn_spacing - 50, btn_y, 100, 36)
+        self.screen.blit(yes_bg, yes_rect)
         yes_text_rect = yes_surface.get_rect(center=(yes_rect[0] + 50, yes_rect[1] + 18))
         self.screen.blit(yes_surface, yes_text_rect)
 
         # No button
-        no_text = f"{button_prompts.get('back', 'O')} No"
-        no_surface = self.font_small.render(no_text, True, Colors.TEXT_LIGHT)
-        no_rect = (self.width // 2 + btn_spacing - 50, btn_y, 100, 36)
-        pygame.draw.rect(self.screen, Colors.TILE_HOVER, no_rect, border_radius=18)
-        pygame.draw.rect(self.screen, Colors.DIVIDER, no_rect, width=1, border_radius=18)
+        no_surface = self._render_prompt(self.NO_PROMPT, button_prompts,
+                                         self.font_small, Colors.TEXT_LIGHT)
+        no_rect = (self.center_x + btn_spacing - 50, btn_y, 100, 36)
+        self.screen.blit(no_bg, no_rect)
         no_text_rect = no_surface.get_rect(center=(no_rect[0] + 50, no_rect[1] + 18))
         self.screen.blit(no_surface, no_text_rect)